@@ -66,6 +66,7 @@ class GeminiAgent(AgentInterface):
                     "thought": thought,
                     "prompt_tokens": self.token_usage["prompt_tokens"],
                     "completion_tokens": self.token_usage["completion_tokens"],
+                    "player_id": self.player_id,
                 },
                 turn_number=turn_number,
             )
@@ -77,7 +78,7 @@ class GeminiAgent(AgentInterface):
             event = GameEvent(
                 event_type=EventType.AGENT_SPOKE,
                 player_id=self.player_id,
-                data={"message": message},
+                data={"message": message, "player_id": self.player_id},
                 turn_number=turn_number,
             )
             await self.event_bus.emit(event)
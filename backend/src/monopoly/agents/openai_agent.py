@@ -64,6 +64,7 @@ class OpenAIAgent(AgentInterface):
                     "thought": thought,
                     "prompt_tokens": self.token_usage["prompt_tokens"],
                     "completion_tokens": self.token_usage["completion_tokens"],
+                    "player_id": self.player_id,
                 },
                 turn_number=turn_number,
             )
@@ -75,7 +76,7 @@ class OpenAIAgent(AgentInterface):
             event = GameEvent(
                 event_type=EventType.AGENT_SPOKE,
                 player_id=self.player_id,
-                data={"message": message},
+                data={"message": message, "player_id": self.player_id},
                 turn_number=turn_number,
             )
             await self.event_bus.emit(event)
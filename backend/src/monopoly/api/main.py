@@ -11,13 +11,15 @@ from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from monopoly.api.routes import router
-from monopoly.api.websocket import websocket_router
-
-# Load environment variables from .env file
+# Load environment variables from .env file. This runs before the route
+# imports because routes reads the API keys once at import time.
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
+from monopoly.api.routes import router  # noqa: E402
+from monopoly.api.storage import game_storage  # noqa: E402
+from monopoly.api.websocket import websocket_router  # noqa: E402
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -36,6 +38,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # Shutdown
     print("🛑 Monopoly AI Agents backend shutting down...")
+    await game_storage.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import uuid
-from typing import Any
+from itertools import islice
+from typing import Any, AsyncIterator, Iterator
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 logger = logging.getLogger(__name__)
 
@@ -24,16 +28,33 @@ from monopoly.api.models import (
     StartGameRequest,
     StartGameResponse,
 )
-from monopoly.api.storage import game_storage
+from monopoly.api.storage import EnrichedEvent, EventHistory, game_storage
 from monopoly.agents.gemini_agent import GeminiAgent
 from monopoly.agents.openai_agent import OpenAIAgent
 from monopoly.agents.personalities import PERSONALITIES, get_personality
 from monopoly.engine.game import Game
+from monopoly.engine.player import STARTING_CASH
+from monopoly.engine.types import ColorGroup, SpaceType
 from monopoly.orchestrator.event_bus import EventBus
 from monopoly.orchestrator.game_runner import GameRunner
 
 router = APIRouter()
 
+# Number of history events encoded per streamed chunk
+HISTORY_BATCH_SIZE = 500
+
+# API keys are read once; the .env file is loaded before this module is imported
+_OPENAI_KEY = os.getenv("OPENAI_API_KEY", "")
+_GOOGLE_KEY = os.getenv("GOOGLE_API_KEY", "")
+
+# Enum names interned once for board serialization
+_TYPE_NAME = {t: t.name for t in SpaceType}
+_COLOR_NAME = {c: c.name for c in ColorGroup}
+
+# Model names served by each agent class
+_OPENAI_MODELS = frozenset({"gpt-4o", "gpt-4o-mini"})
+_GEMINI_MODELS = frozenset({"gemini-pro", "gemini-flash", "gemini-2.0-flash"})
+
 
 # ── Helper Functions ──
 
@@ -62,19 +83,18 @@ def create_agent_from_config(player_id: int, config: AgentConfig | None = None,
     personality = get_personality(player_id)
 
     # Map model string to agent class
-    import os
-    if config.model in ["gpt-4o", "gpt-4o-mini"]:
+    if config.model in _OPENAI_MODELS:
         return OpenAIAgent(
             player_id=player_id,
             personality=personality,
-            api_key=os.getenv("OPENAI_API_KEY", ""),
+            api_key=_OPENAI_KEY,
             event_bus=event_bus,
         )
-    elif config.model in ["gemini-pro", "gemini-flash", "gemini-2.0-flash"]:
+    elif config.model in _GEMINI_MODELS:
         return GeminiAgent(
             player_id=player_id,
             personality=personality,
-            api_key=os.getenv("GOOGLE_API_KEY", ""),
+            api_key=_GOOGLE_KEY,
             event_bus=event_bus,
         )
     else:
@@ -88,13 +108,106 @@ def serialize_player_summary(player_id: int, config: AgentConfig) -> dict[str, A
         "name": config.name,
         "model": config.model,
         "personality": config.personality,
+        "cash": STARTING_CASH,
+        "position": 0,
         "avatar": config.avatar or "default",
         "color": config.color or "#CCCCCC",
-        "cash": 1500,
-        "position": 0,
     }
 
 
+async def _stream_history(
+    game_id: str,
+    event_history: EventHistory,
+    events: Iterator[EnrichedEvent],
+    first_chunk: bytes,
+    sent: int,
+    since: int,
+) -> AsyncIterator[bytes]:
+    """
+    Stream a GameHistoryResponse body in batches of encoded events.
+
+    The first batch is encoded by the caller before the response starts, so
+    an encoding failure there is still reported as a normal error response.
+
+    Args:
+        game_id: Game identifier
+        event_history: History the events are read from
+        events: Remaining filtered events, after the first batch
+        first_chunk: Encoded first batch (without the enclosing brackets)
+        sent: Number of events in the first batch
+        since: Sequence number the stream started from
+
+    Yields:
+        Chunks of the JSON response body
+    """
+    yield b'{"game_id":' + orjson.dumps(game_id) + b',"events":[' + first_chunk
+
+    try:
+        while batch := list(islice(events, HISTORY_BATCH_SIZE)):
+            chunk = orjson.dumps(batch)[1:-1]
+            yield chunk if sent == 0 else b"," + chunk
+            sent += len(batch)
+    except Exception as e:
+        logger.error(f"Failed to stream history for game {game_id}: {e}", exc_info=True)
+        raise
+
+    total_events = event_history.get_event_count()
+    yield b"]," + orjson.dumps({
+        "total_events": total_events,
+        "has_more": total_events > (since + sent),
+    })[1:]
+
+
+def _build_agents_info() -> list[AgentInfo]:
+    """Build the static agent descriptions served by the agents endpoint."""
+    # Map personality to description
+    descriptions = {
+        0: "An aggressive negotiator who buys everything in sight, trades ruthlessly, and intimidates opponents into bad deals. Favors monopoly acquisition at any cost.",
+        1: "An analytical strategist who calculates expected values for every decision, builds methodically, and only accepts trades with clear mathematical advantage.",
+        2: "A charismatic bluffer who makes lopsided trade offers sound amazing, takes unpredictable risks, and uses charm to manipulate other agents.",
+        3: "A conservative builder who hoards cash, avoids risky trades, and only develops properties when holding complete monopolies with ample reserves.",
+    }
+
+    # Map to style parameters
+    risk_map = {0: "high", 1: "medium", 2: "high", 3: "low"}
+    trading_map = {0: "very_high", 1: "medium", 2: "very_high", 3: "low"}
+    building_map = {0: "opportunistic", 1: "methodical", 2: "unpredictable", 3: "patient"}
+    speech_patterns = {
+        0: "Threatening, confident, uses ultimatums",
+        1: "Precise, data-driven, quotes probabilities",
+        2: "Persuasive, flattering, changes the subject",
+        3: "Cautious, brief, politely declines most offers",
+    }
+
+    agents_info = []
+    for i in range(4):
+        personality = get_personality(i)
+        agents_info.append(
+            AgentInfo(
+                id=i,
+                name=personality.name,
+                model=personality.model,
+                personality=personality.archetype.split()[0].lower(),
+                avatar=personality.avatar,
+                color=personality.color,
+                description=descriptions[i],
+                style={
+                    "risk_tolerance": risk_map[i],
+                    "trading_aggression": trading_map[i],
+                    "building_strategy": building_map[i],
+                    "speech_pattern": speech_patterns[i],
+                },
+            )
+        )
+    return agents_info
+
+
+# Pre-encoded {"agents": [...]} body; get_agents splices in the game_id
+_AGENTS_JSON_TEMPLATE: bytes = orjson.dumps(
+    {"agents": [agent.model_dump() for agent in _build_agents_info()]}
+)
+
+
 # ── Endpoints ──
 
 
@@ -113,12 +226,16 @@ async def list_games() -> dict[str, Any]:
 
 
 @router.post("/game/start", response_model=StartGameResponse, status_code=201)
-async def start_game(request: StartGameRequest) -> StartGameResponse:
+async def start_game(request: StartGameRequest) -> Response:
     """
     Start a new Monopoly game with 4 AI agents.
 
     Creates a new game instance, initializes agents, and starts the game loop
     in the background.
+
+    The player summaries are already in their final shape, so the response is
+    encoded directly with orjson instead of being re-validated against
+    StartGameResponse (which is still used for the OpenAPI schema).
     """
     # Validate request
     if request.num_players != 4:
@@ -142,7 +259,7 @@ async def start_game(request: StartGameRequest) -> StartGameResponse:
         )
 
     # Generate game ID
-    game_id = str(uuid.uuid4())
+    game_id = uuid.uuid4().hex
 
     # Create event bus first (needed for agents)
     event_bus = EventBus()
@@ -200,16 +317,7 @@ async def start_game(request: StartGameRequest) -> StartGameResponse:
 
         # Store game runner
         game_storage.add_game(game_id, game_runner, event_bus)
-
-        # Set up event history listener
-        event_history = game_storage.get_event_history(game_id)
-
-        async def history_listener(event: Any) -> None:
-            """Add events to history."""
-            if event_history:
-                event_history.add_event(event, game_runner.game.turn_number)
-
-        await event_bus.subscribe("*", history_listener)
+        session = game_storage.get_session(game_id)
 
         # Start game loop in background with error handling
         async def run_game_with_error_handling() -> None:
@@ -218,20 +326,27 @@ async def start_game(request: StartGameRequest) -> StartGameResponse:
                 logger.info(f"Starting game loop for game {game_id}")
                 await game_runner.run_game()
                 logger.info(f"Game {game_id} completed successfully")
+            except asyncio.CancelledError:
+                logger.info(f"Game {game_id} loop cancelled")
+                raise
             except Exception as e:
                 logger.error(f"Game {game_id} failed with error: {e}", exc_info=True)
                 # Keep game in storage for post-mortem analysis
                 # Game state will show as failed in logs
 
-        asyncio.create_task(run_game_with_error_handling())
+        game_storage.start_task(game_id, run_game_with_error_handling())
 
         # Return response
-        return StartGameResponse(
-            game_id=game_id,
-            players=player_summaries,
-            status="in_progress",
-            seed=request.seed or game_runner.seed,
-            created_at=game_storage.get_created_at(game_id),
+        return Response(
+            content=orjson.dumps({
+                "game_id": game_id,
+                "players": player_summaries,
+                "status": "in_progress",
+                "seed": request.seed or game_runner.seed,
+                "created_at": session.created_at,
+            }),
+            status_code=201,
+            media_type="application/json",
         )
 
     except Exception as e:
@@ -255,8 +370,8 @@ async def get_game_state(game_id: str) -> Any:
     logger.debug(f"State request for game {game_id}")
     logger.debug(f"Active games in storage: {game_storage.list_games()}")
 
-    game_runner = game_storage.get_game(game_id)
-    if not game_runner:
+    session = game_storage.get_session(game_id)
+    if not session:
         logger.warning(f"Game {game_id} not found in storage. Active games: {game_storage.list_games()}")
         raise HTTPException(
             status_code=404,
@@ -266,6 +381,7 @@ async def get_game_state(game_id: str) -> Any:
                 details={"game_id": game_id},
             ).model_dump(),
         )
+    game_runner = session.runner
 
     # Get state from game runner
     state = game_runner.get_state()
@@ -288,11 +404,11 @@ async def get_game_state(game_id: str) -> Any:
     # Serialize board (simplified for now - full implementation needed)
     board = []
     for i in range(40):
-        space = game_runner.game.board.get_space(i)
+        space = game_runner.game.board.get_space_unchecked(i)
         space_dict = {
             "position": i,
             "name": space.name,
-            "type": space.space_type.name,
+            "type": _TYPE_NAME[space.space_type],
             "owner_id": state["property_ownership"].get(i),
             "houses": 0,
             "is_mortgaged": False,
@@ -307,7 +423,7 @@ async def get_game_state(game_id: str) -> Any:
         # Add property-specific data
         if space.property_data:
             space_dict.update({
-                "color_group": space.property_data.color_group.name,
+                "color_group": _COLOR_NAME[space.property_data.color_group],
                 "price": space.property_data.price,
                 "rent_schedule": list(space.property_data.rent),
                 "house_cost": space.property_data.house_cost,
@@ -360,7 +476,7 @@ async def get_game_state(game_id: str) -> Any:
             "hotels_available": game_runner.game.bank.hotels_available,
         },
         "last_roll": last_roll,
-        "created_at": game_storage.get_created_at(game_id),
+        "created_at": session.created_at,
     }
 
 
@@ -370,11 +486,12 @@ async def get_game_history(
     since: int = Query(0, ge=0, description="Return events with sequence >= since"),
     limit: int = Query(1000, ge=1, le=10000, description="Maximum number of events"),
     event_type: str | None = Query(None, description="Filter by event type (comma-separated)"),
-) -> GameHistoryResponse:
+) -> StreamingResponse:
     """
     Get the event history for a game.
 
-    Supports filtering by sequence number, event type, and limit.
+    Supports filtering by sequence number, event type, and limit. The response
+    is streamed so large histories are never fully materialized in memory.
     """
     event_history = game_storage.get_event_history(game_id)
     if not event_history:
@@ -392,23 +509,13 @@ async def get_game_history(
     if event_type:
         event_types = [t.strip() for t in event_type.split(",")]
 
-    # Get events from event history
-    events = event_history.get_events(since=since, limit=limit, event_types=event_types)
+    events = event_history.iter_events(since=since, limit=limit, event_types=event_types)
+    first_batch = list(islice(events, HISTORY_BATCH_SIZE))
+    first_chunk = orjson.dumps(first_batch)[1:-1]
 
-    return GameHistoryResponse(
-        game_id=game_id,
-        events=[
-            {
-                "event": e.event,
-                "data": e.data,
-                "timestamp": e.timestamp,
-                "turn_number": e.turn_number,
-                "sequence": e.sequence,
-            }
-            for e in events
-        ],
-        total_events=event_history.get_event_count(),
-        has_more=event_history.get_event_count() > (since + len(events)),
+    return StreamingResponse(
+        _stream_history(game_id, event_history, events, first_chunk, len(first_batch), since),
+        media_type="application/json",
     )
 
 
@@ -519,11 +626,13 @@ async def set_game_speed(game_id: str, request: SetSpeedRequest) -> SetSpeedResp
 
 
 @router.get("/game/{game_id}/agents", response_model=AgentsResponse)
-async def get_agents(game_id: str) -> AgentsResponse:
+async def get_agents(game_id: str) -> Response:
     """
     Get detailed information about all AI agents in the game.
 
     Includes personality descriptions, behavioral parameters, and configuration.
+    The agent list is identical for every game, so only the game_id is spliced
+    into a body encoded once at import time.
     """
     game_runner = game_storage.get_game(game_id)
     if not game_runner:
@@ -536,49 +645,7 @@ async def get_agents(game_id: str) -> AgentsResponse:
             ).model_dump(),
         )
 
-    # Get agent info from personalities
-    agents_info = []
-    for i in range(4):
-        personality = get_personality(i)
-
-        # Map personality to description
-        descriptions = {
-            0: "An aggressive negotiator who buys everything in sight, trades ruthlessly, and intimidates opponents into bad deals. Favors monopoly acquisition at any cost.",
-            1: "An analytical strategist who calculates expected values for every decision, builds methodically, and only accepts trades with clear mathematical advantage.",
-            2: "A charismatic bluffer who makes lopsided trade offers sound amazing, takes unpredictable risks, and uses charm to manipulate other agents.",
-            3: "A conservative builder who hoards cash, avoids risky trades, and only develops properties when holding complete monopolies with ample reserves.",
-        }
-
-        # Map to style parameters
-        risk_map = {0: "high", 1: "medium", 2: "high", 3: "low"}
-        trading_map = {0: "very_high", 1: "medium", 2: "very_high", 3: "low"}
-        building_map = {0: "opportunistic", 1: "methodical", 2: "unpredictable", 3: "patient"}
-        speech_patterns = {
-            0: "Threatening, confident, uses ultimatums",
-            1: "Precise, data-driven, quotes probabilities",
-            2: "Persuasive, flattering, changes the subject",
-            3: "Cautious, brief, politely declines most offers",
-        }
-
-        agents_info.append(
-            AgentInfo(
-                id=i,
-                name=personality.name,
-                model=personality.model,
-                personality=personality.archetype.split()[0].lower(),
-                avatar=personality.avatar,
-                color=personality.color,
-                description=descriptions[i],
-                style={
-                    "risk_tolerance": risk_map[i],
-                    "trading_aggression": trading_map[i],
-                    "building_strategy": building_map[i],
-                    "speech_pattern": speech_patterns[i],
-                },
-            )
-        )
-
-    return AgentsResponse(
-        game_id=game_id,
-        agents=agents_info,
+    return Response(
+        content=b'{"game_id":' + orjson.dumps(game_id) + b"," + _AGENTS_JSON_TEMPLATE[1:],
+        media_type="application/json",
     )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict
+from itertools import islice
+from typing import Any, Callable, Coroutine, Dict, Iterator
 
 from monopoly.engine.types import GameEvent
 from monopoly.orchestrator.event_bus import EventBus
@@ -22,19 +24,44 @@ class EnrichedEvent:
     sequence: int
 
 
+# Synchronous callback invoked with each event as it is recorded
+HistoryListener = Callable[[EnrichedEvent], None]
+
+
 class EventHistory:
     """Tracks event history for a game with sequence numbers."""
 
     def __init__(self) -> None:
         self._events: list[EnrichedEvent] = []
         self._sequence_counter: int = 0
+        self._listeners: list[HistoryListener] = []
+
+    def add_listener(self, listener: HistoryListener) -> None:
+        """
+        Register a callback that receives every event after it is recorded.
+
+        Lets consumers such as WebSocket connections forward the recorded
+        event (with its sequence number) instead of recording it again.
+
+        Args:
+            listener: Plain function accepting an EnrichedEvent; must not block
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: HistoryListener) -> None:
+        """Remove a listener. Does nothing if it isn't registered."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
     def add_event(self, event: GameEvent, turn_number: int) -> EnrichedEvent:
         """Add an event to history and return enriched version."""
-        # Include player_id in data if not already there
-        event_data = dict(event.data)
+        # Include player_id in data if not already there. Emitters on the bus
+        # (GameRunner, LLM agents) already put it in data, so their dict is
+        # shared as-is; other events get a copy. System events carry the
+        # GameEvent default of -1.
+        event_data = event.data
         if "player_id" not in event_data and event.player_id is not None:
-            event_data["player_id"] = event.player_id
+            event_data = {**event_data, "player_id": event.player_id}
 
         enriched = EnrichedEvent(
             event=event.event_type.name,  # Keep uppercase to match frontend expectations
@@ -45,39 +72,83 @@ class EventHistory:
         )
         self._sequence_counter += 1
         self._events.append(enriched)
+        for listener in self._listeners:
+            listener(enriched)
         return enriched
 
-    def get_events(
+    def iter_events(
         self,
         since: int = 0,
         limit: int = 1000,
         event_types: list[str] | None = None,
-    ) -> list[EnrichedEvent]:
-        """Get events from history with filtering."""
-        filtered = [e for e in self._events if e.sequence >= since]
+    ) -> Iterator[EnrichedEvent]:
+        """Lazily iterate events from history with filtering."""
+        # Sequence numbers match list indices, so index from `since` directly
+        # instead of stepping over the earlier events.
+        events: Iterator[EnrichedEvent] = map(self._events.__getitem__, range(since, len(self._events)))
 
         if event_types:
-            filtered = [e for e in filtered if e.event in event_types]
+            events = (e for e in events if e.event in event_types)
 
-        return filtered[:limit]
+        return islice(events, limit)
+
+    def get_events(
+        self,
+        since: int = 0,
+        limit: int = 1000,
+        event_types: list[str] | None = None,
+    ) -> list[EnrichedEvent]:
+        """Get events from history with filtering."""
+        return list(self.iter_events(since=since, limit=limit, event_types=event_types))
 
     def get_event_count(self) -> int:
         """Get total number of events."""
         return len(self._events)
 
 
+@dataclass
+class GameSession:
+    """Everything stored for a single game, co-located under one key."""
+
+    runner: GameRunner
+    bus: EventBus
+    history: EventHistory = field(default_factory=EventHistory)
+    created_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    )
+    task: asyncio.Task | None = None  # Background game loop, owned by the session
+    sync_cache: tuple[tuple, bytes] | None = None  # (state version, encoded game_state_sync)
+
+    def record_event(self, event: GameEvent) -> None:
+        """Event bus tap that appends every event to this session's history."""
+        self.history.add_event(event, self.runner.game.turn_number)
+
+    def close(self) -> None:
+        """
+        Stop the game loop and detach history recording from the bus.
+
+        The runner is stopped as well as its task cancelled: the loop checks
+        both, so it exits even if a cancel() is swallowed by an agent call.
+        """
+        self.runner.stop()
+        self.bus.remove_tap(self.record_event)
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+
 class GameStorage:
     """
     In-memory storage for active game sessions.
 
-    Maps game_id → (GameRunner, EventBus, EventHistory, created_at)
+    Maps game_id → GameSession (GameRunner, EventBus, EventHistory, created_at)
+
+    Each session is fully built before it is published, and adding or removing
+    a game is a single dict assignment/pop. Concurrent requests therefore never
+    observe a partially registered game, and no lock is needed.
     """
 
     def __init__(self) -> None:
-        self._games: Dict[str, GameRunner] = {}
-        self._event_buses: Dict[str, EventBus] = {}
-        self._event_histories: Dict[str, EventHistory] = {}
-        self._created_at: Dict[str, str] = {}
+        self._sessions: Dict[str, GameSession] = {}
 
     def add_game(self, game_id: str, game_runner: GameRunner, event_bus: EventBus) -> None:
         """
@@ -88,10 +159,24 @@ class GameStorage:
             game_runner: GameRunner instance
             event_bus: EventBus instance
         """
-        self._games[game_id] = game_runner
-        self._event_buses[game_id] = event_bus
-        self._event_histories[game_id] = EventHistory()
-        self._created_at[game_id] = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        session = GameSession(runner=game_runner, bus=event_bus)
+        # History needs every event type (including agent events emitted
+        # straight onto the bus), so it is recorded through a synchronous tap
+        # rather than an async wildcard subscriber.
+        event_bus.add_tap(session.record_event)
+        self._sessions[game_id] = session
+
+    def get_session(self, game_id: str) -> GameSession | None:
+        """
+        Get the full session record for a game.
+
+        Args:
+            game_id: Game identifier
+
+        Returns:
+            GameSession if found, None otherwise
+        """
+        return self._sessions.get(game_id)
 
     def get_game(self, game_id: str) -> GameRunner | None:
         """
@@ -103,7 +188,8 @@ class GameStorage:
         Returns:
             GameRunner if found, None otherwise
         """
-        return self._games.get(game_id)
+        session = self._sessions.get(game_id)
+        return session.runner if session else None
 
     def get_event_bus(self, game_id: str) -> EventBus | None:
         """
@@ -115,7 +201,8 @@ class GameStorage:
         Returns:
             EventBus if found, None otherwise
         """
-        return self._event_buses.get(game_id)
+        session = self._sessions.get(game_id)
+        return session.bus if session else None
 
     def get_event_history(self, game_id: str) -> EventHistory | None:
         """
@@ -127,7 +214,8 @@ class GameStorage:
         Returns:
             EventHistory if found, None otherwise
         """
-        return self._event_histories.get(game_id)
+        session = self._sessions.get(game_id)
+        return session.history if session else None
 
     def get_created_at(self, game_id: str) -> str | None:
         """
@@ -139,19 +227,54 @@ class GameStorage:
         Returns:
             ISO 8601 timestamp string if found, None otherwise
         """
-        return self._created_at.get(game_id)
+        session = self._sessions.get(game_id)
+        return session.created_at if session else None
+
+    def start_task(self, game_id: str, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """
+        Run a game's background loop as a task tied to its session.
+
+        The session holds the only strong reference to the task, so the loop
+        can't be garbage collected mid-game and is cancelled with the session.
+
+        Args:
+            game_id: Game identifier (must already be in storage)
+            coro: Coroutine running the game loop
+
+        Returns:
+            The created task
+        """
+        session = self._sessions[game_id]
+        session.task = asyncio.create_task(coro, name=f"game-{game_id}")
+        return session.task
 
     def remove_game(self, game_id: str) -> None:
         """
-        Remove a game from storage.
+        Remove a game from storage, cancelling its background loop if running.
 
         Args:
             game_id: Game identifier
         """
-        self._games.pop(game_id, None)
-        self._event_buses.pop(game_id, None)
-        self._event_histories.pop(game_id, None)
-        self._created_at.pop(game_id, None)
+        session = self._sessions.pop(game_id, None)
+        if session:
+            session.close()
+
+    async def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Stop every running game loop and wait for them to finish unwinding.
+
+        Called on application shutdown so game tasks are torn down
+        deterministically instead of being destroyed while still pending.
+
+        Args:
+            timeout: Seconds to wait for the loops before giving up on them
+        """
+        tasks = [s.task for s in self._sessions.values() if s.task and not s.task.done()]
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        if tasks:
+            await asyncio.wait(tasks, timeout=timeout)
 
     def list_games(self) -> list[str]:
         """
@@ -160,7 +283,7 @@ class GameStorage:
         Returns:
             List of game ID strings
         """
-        return list(self._games.keys())
+        return list(self._sessions.keys())
 
     def count(self) -> int:
         """
@@ -169,7 +292,7 @@ class GameStorage:
         Returns:
             Number of games in storage
         """
-        return len(self._games)
+        return len(self._sessions)
 
 
 # Global storage instance
@@ -3,17 +3,57 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 
-from monopoly.api.storage import game_storage, EnrichedEvent
-from monopoly.engine.types import GameEvent
+from monopoly.api.storage import game_storage, EnrichedEvent, EventHistory, HistoryListener
+from monopoly.engine.board import Board
 
 websocket_router = APIRouter()
 
+# Per-space fields that never change between games, built once at import
+_BOARD_SKELETON: tuple[dict[str, Any], ...] = tuple(
+    {"position": space.position, "name": space.name, "type": space.space_type.name}
+    for space in Board().spaces
+)
+
+
+# Maximum number of encoded events buffered for one client before it is dropped
+CLIENT_QUEUE_SIZE = 64
+
+
+class ClientSession:
+    """
+    A connected client with a bounded queue of outgoing messages.
+
+    A dedicated writer task drains the queue, so a slow client never blocks
+    the game's forwarder. Its memory is capped at CLIENT_QUEUE_SIZE payloads.
+    """
+
+    __slots__ = ("websocket", "queue", "writer")
+
+    def __init__(self, websocket: WebSocket, max_queue: int = CLIENT_QUEUE_SIZE) -> None:
+        self.websocket = websocket
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=max_queue)
+        self.writer = asyncio.create_task(self._write())
+
+    async def _write(self) -> None:
+        """Send queued payloads in order until the connection fails."""
+        while True:
+            payload = await self.queue.get()
+            try:
+                await self.websocket.send_bytes(payload)
+            except Exception:
+                # Connection closed; the manager drops this client on its next send
+                return
+
+    def close(self) -> None:
+        """Stop the writer task."""
+        self.writer.cancel()
+
 
 class ConnectionManager:
     """
@@ -23,24 +63,43 @@ class ConnectionManager:
     all connected clients receive it.
     """
 
-    def __init__(self) -> None:
-        # Map game_id → list of active WebSocket connections
-        self.active_connections: dict[str, list[WebSocket]] = {}
+    __slots__ = ("active_connections", "_clients", "_forwarders")
 
-    async def connect(self, websocket: WebSocket, game_id: str) -> None:
+    def __init__(self) -> None:
+        # Map game_id → set of active WebSocket connections (O(1) add/remove)
+        self.active_connections: dict[str, set[WebSocket]] = {}
+        # Map WebSocket → its client session (outgoing queue + writer task)
+        self._clients: dict[WebSocket, ClientSession] = {}
+        # Map game_id → (history, listener, task) of the game's single event forwarder
+        self._forwarders: dict[str, tuple[EventHistory, HistoryListener, asyncio.Task]] = {}
+
+    async def connect(self, websocket: WebSocket, game_id: str, event_history: EventHistory) -> None:
         """
-        Accept a new WebSocket connection and subscribe to game events.
+        Accept a new WebSocket connection and subscribe it to game events.
+
+        The client is sent the game_state_sync before it starts receiving
+        events. The first connection for a game starts that game's forwarder.
 
         Args:
             websocket: The WebSocket connection
             game_id: Game identifier
+            event_history: History whose recorded events are forwarded
         """
         await websocket.accept()
+        await send_game_state_sync(websocket, game_id)
+
+        self._add_client(websocket, game_id)
 
+        if game_id not in self._forwarders:
+            self._start_forwarder(game_id, event_history)
+
+    def _add_client(self, websocket: WebSocket, game_id: str) -> None:
+        """Register a connection and start its writer."""
         if game_id not in self.active_connections:
-            self.active_connections[game_id] = []
+            self.active_connections[game_id] = set()
 
-        self.active_connections[game_id].append(websocket)
+        self.active_connections[game_id].add(websocket)
+        self._clients[websocket] = ClientSession(websocket)
 
     def disconnect(self, websocket: WebSocket, game_id: str) -> bool:
         """
@@ -53,42 +112,92 @@ class ConnectionManager:
         Returns:
             True if this was the last connection for the game
         """
+        client = self._clients.pop(websocket, None)
+        if client is not None:
+            client.close()
+
         if game_id in self.active_connections:
-            if websocket in self.active_connections[game_id]:
-                self.active_connections[game_id].remove(websocket)
+            self.active_connections[game_id].discard(websocket)
 
-            # Clean up empty lists
+            # Clean up empty sets
             if not self.active_connections[game_id]:
                 del self.active_connections[game_id]
+                self._stop_forwarder(game_id)
                 return True
 
         return False
 
-    async def send_event(self, game_id: str, event: dict[str, Any]) -> None:
+    def _start_forwarder(self, game_id: str, event_history: EventHistory) -> None:
+        """
+        Forward every event recorded in a game's history to its clients.
+
+        One forwarder per game encodes each event once and fans it out,
+        however many clients are connected. Events are queued by the history
+        listener and sent in order by a single task.
+        """
+        queue: asyncio.Queue[EnrichedEvent] = asyncio.Queue()
+
+        async def forward_events() -> None:
+            while True:
+                enriched = await queue.get()
+                await self.send_event(game_id, enriched)
+
+        event_history.add_listener(queue.put_nowait)
+        task = asyncio.create_task(forward_events(), name=f"ws-forwarder-{game_id}")
+        self._forwarders[game_id] = (event_history, queue.put_nowait, task)
+
+    def _stop_forwarder(self, game_id: str) -> None:
+        """Detach and cancel a game's forwarder, if it has one."""
+        forwarder = self._forwarders.pop(game_id, None)
+        if forwarder is not None:
+            event_history, listener, task = forwarder
+            event_history.remove_listener(listener)
+            task.cancel()
+
+    async def send_event(self, game_id: str, event: dict[str, Any] | EnrichedEvent) -> None:
         """
-        Send an event to all connected clients for a game.
+        Queue an event for every connected client of a game.
+
+        The event is encoded once and handed to each client's writer. A
+        client whose connection failed, or whose queue is full because it
+        can't keep up, is dropped and closed rather than buffered without
+        bound; it can reconnect and resync.
 
         Args:
             game_id: Game identifier
-            event: Event data to send as JSON
+            event: Event data to send as JSON (encoded once with orjson;
+                   EnrichedEvent dataclasses are encoded directly)
         """
-        if game_id not in self.active_connections:
+        # Skip encoding entirely when nobody is watching (e.g. every client
+        # dropped mid-turn while events are still flushing through)
+        connections = self.active_connections.get(game_id)
+        if not connections:
             return
 
-        # Send to all connections
-        disconnected = []
-        for connection in self.active_connections[game_id]:
+        payload = orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS)
+        dropped = []
+        for connection in connections:
+            client = self._clients[connection]
+            if client.writer.done() or connection.client_state != WebSocketState.CONNECTED:
+                dropped.append(connection)
+                continue
             try:
-                if connection.client_state == WebSocketState.CONNECTED:
-                    await connection.send_json(event)
-                else:
-                    disconnected.append(connection)
-            except Exception:
-                disconnected.append(connection)
+                client.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                dropped.append(connection)
 
-        # Clean up disconnected connections
-        for connection in disconnected:
+        # Clean up dropped connections
+        for connection in dropped:
             self.disconnect(connection, game_id)
+            asyncio.create_task(_close_quietly(connection))
+
+
+async def _close_quietly(websocket: WebSocket) -> None:
+    """Close a connection the server dropped, ignoring already-closed sockets."""
+    try:
+        await websocket.close(code=1013)  # Try again later
+    except Exception:
+        pass
 
 
 # Global connection manager
@@ -103,32 +212,46 @@ async def send_game_state_sync(websocket: WebSocket, game_id: str) -> None:
         websocket: The WebSocket connection
         game_id: Game identifier
     """
-    game_runner = game_storage.get_game(game_id)
-    if not game_runner:
+    session = game_storage.get_session(game_id)
+    if not session:
+        return
+    game_runner = session.runner
+    game = game_runner.game
+
+    # Every state change is recorded as an event or moves the turn, so the
+    # encoded sync is reused until one of these changes. Viewers joining the
+    # same game in a burst get the cached bytes.
+    version = (
+        session.history.get_event_count(),
+        game.turn_number,
+        game.current_player_index,
+        game.turn_phase,
+        game_runner.speed,
+        game_runner._running,
+        game_runner._paused,
+    )
+    cached = session.sync_cache
+    if cached is not None and cached[0] == version:
+        await websocket.send_bytes(cached[1])
         return
 
     # Get current game state
     state = game_runner.get_state()
 
-    # Serialize board state
-    board = []
-    for i in range(40):
-        space = game_runner.game.board.get_space(i)
-        space_dict = {
-            "position": i,
-            "name": space.name,
-            "type": space.space_type.name,
-            "owner_id": state["property_ownership"].get(i),
-            "houses": 0,
-            "is_mortgaged": False,
+    # Serialize board state: copy the static skeleton and overlay game state.
+    # Houses and mortgages are gathered from the players in one pass.
+    owners = state["property_ownership"]
+    mortgaged = set().union(*(p["mortgaged"] for p in state["players"]))
+    houses = {pos: n for p in state["players"] for pos, n in p["houses"].items()}
+    board = [
+        {
+            **skeleton,
+            "owner_id": owners.get(i),
+            "houses": houses.get(i, 0),
+            "is_mortgaged": i in mortgaged,
         }
-        # Add houses and mortgage status from player state
-        for p in state["players"]:
-            if i in p["mortgaged"]:
-                space_dict["is_mortgaged"] = True
-            if i in p["houses"]:
-                space_dict["houses"] = p["houses"][i]
-        board.append(space_dict)
+        for i, skeleton in enumerate(_BOARD_SKELETON)
+    ]
 
     # Send as game_state_sync event
     sync_event = {
@@ -148,12 +271,15 @@ async def send_game_state_sync(websocket: WebSocket, game_id: str) -> None:
             },
             "last_roll": state["last_roll"],
         },
-        "timestamp": game_storage.get_created_at(game_id),
+        "timestamp": session.created_at,
         "turn_number": state["turn_number"],
         "sequence": 0,
     }
 
-    await websocket.send_json(sync_event)
+    # Player house maps are keyed by int position
+    payload = orjson.dumps(sync_event, option=orjson.OPT_NON_STR_KEYS)
+    session.sync_cache = (version, payload)
+    await websocket.send_bytes(payload)
 
 
 async def send_error_and_close(websocket: WebSocket, error: str, code: str, close_code: int = 1008) -> None:
@@ -178,7 +304,7 @@ async def send_error_and_close(websocket: WebSocket, error: str, code: str, clos
     }
 
     try:
-        await websocket.send_json(error_event)
+        await websocket.send_bytes(orjson.dumps(error_event))
     except Exception:
         pass
 
@@ -206,10 +332,9 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str) -> None:
     - {"action": "set_speed", "data": {"speed": 2.0}}
     """
     # Validate game exists
-    game_runner = game_storage.get_game(game_id)
-    event_bus = game_storage.get_event_bus(game_id)
+    session = game_storage.get_session(game_id)
 
-    if not game_runner or not event_bus:
+    if not session:
         await send_error_and_close(
             websocket,
             error="Game not found",
@@ -217,45 +342,22 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str) -> None:
             close_code=4404,
         )
         return
+    game_runner = session.runner
 
-    # Accept connection
-    await manager.connect(websocket, game_id)
-
-    # Send initial state sync
-    await send_game_state_sync(websocket, game_id)
-
-    # Get event history to subscribe to new events
-    event_history = game_storage.get_event_history(game_id)
-
-    # Create event listener for this connection
-    async def event_listener(event: GameEvent) -> None:
-        """Forward events from event bus to WebSocket."""
-        # Convert to enriched event
-        if event_history:
-            enriched = event_history.add_event(event, game_runner.game.turn_number)
-            event_data = {
-                "event": enriched.event,
-                "data": enriched.data,
-                "timestamp": enriched.timestamp,
-                "turn_number": enriched.turn_number,
-                "sequence": enriched.sequence,
-            }
-            try:
-                if websocket.client_state == WebSocketState.CONNECTED:
-                    await websocket.send_json(event_data)
-            except Exception:
-                # Connection closed, will be cleaned up
-                pass
-
-    # Subscribe to event bus
-    await event_bus.subscribe("*", event_listener)
+    # Accept connection, send initial state sync, and start forwarding events
+    await manager.connect(websocket, game_id, session.history)
 
     try:
         # Listen for client messages
         while True:
             try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                # Read the raw frame so control messages go straight to
+                # orjson: browsers send text frames, other clients may send
+                # bytes, and neither needs a separate decode step.
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+                message = orjson.loads(frame.get("bytes") or frame.get("text") or "")
 
                 # Handle control messages
                 action = message.get("action")
@@ -270,7 +372,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str) -> None:
 
             except WebSocketDisconnect:
                 break
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Invalid JSON, ignore
                 pass
             except Exception:
@@ -278,9 +380,10 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str) -> None:
                 pass
 
     finally:
-        # Cleanup
-        await event_bus.unsubscribe("*", event_listener)
-        was_last = manager.disconnect(websocket, game_id)
+        # Cleanup. The manager may already have dropped a slow client, so
+        # "last viewer" is judged by whether any connection remains.
+        manager.disconnect(websocket, game_id)
+        was_last = game_id not in manager.active_connections
 
         # Stop the game when the last viewer disconnects (browser closed/refreshed)
         if was_last and game_runner._running:
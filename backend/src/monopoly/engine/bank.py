@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 MAX_HOUSES = 32
 MAX_HOTELS = 12
 
 
-@dataclass
+@dataclass(slots=True)
 class Bank:
     """The Monopoly bank managing houses, hotels, and auctions."""
 
@@ -25,7 +25,8 @@ class Bank:
 
     def return_house(self) -> None:
         """Return a house to the bank."""
-        self.houses_available = min(self.houses_available + 1, MAX_HOUSES)
+        houses = self.houses_available + 1
+        self.houses_available = houses if houses < MAX_HOUSES else MAX_HOUSES
 
     def buy_hotel(self) -> bool:
         """Buy a hotel from the bank. Returns False if none available."""
@@ -36,7 +37,8 @@ class Bank:
 
     def return_hotel(self) -> None:
         """Return a hotel to the bank."""
-        self.hotels_available = min(self.hotels_available + 1, MAX_HOTELS)
+        hotels = self.hotels_available + 1
+        self.hotels_available = hotels if hotels < MAX_HOTELS else MAX_HOTELS
 
     def upgrade_to_hotel(self) -> bool:
         """Upgrade from 4 houses to a hotel: take hotel, return 4 houses.
@@ -44,7 +46,8 @@ class Bank:
         if self.hotels_available <= 0:
             return False
         self.hotels_available -= 1
-        self.houses_available = min(self.houses_available + 4, MAX_HOUSES)
+        houses = self.houses_available + 4
+        self.houses_available = houses if houses < MAX_HOUSES else MAX_HOUSES
         return True
 
     def downgrade_from_hotel(self) -> bool:
@@ -53,7 +56,8 @@ class Bank:
         if self.houses_available < 4:
             return False
         self.houses_available -= 4
-        self.hotels_available = min(self.hotels_available + 1, MAX_HOTELS)
+        hotels = self.hotels_available + 1
+        self.hotels_available = hotels if hotels < MAX_HOTELS else MAX_HOTELS
         return True
 
     @property
@@ -1,5 +1,7 @@
 """Monopoly board layout — all 40 spaces with complete property data."""
 
+from dataclasses import replace
+
 from monopoly.engine.types import (
     ColorGroup,
     PropertyData,
@@ -86,6 +88,10 @@ RAILROAD_RENTS = {1: 25, 2: 50, 3: 100, 4: 200}
 # Utility multiplier based on number owned
 UTILITY_MULTIPLIERS = {1: 4, 2: 10}
 
+# The same tables indexed directly by count owned (index 0 = none owned)
+RAILROAD_RENT_TABLE: tuple[int, ...] = (0,) + tuple(RAILROAD_RENTS[n] for n in range(1, 5))
+UTILITY_MULTIPLIER_TABLE: tuple[int, ...] = (0,) + tuple(UTILITY_MULTIPLIERS[n] for n in range(1, 3))
+
 # Color group to positions mapping
 COLOR_GROUP_POSITIONS: dict[ColorGroup, list[int]] = {
     ColorGroup.BROWN: [1, 3],
@@ -98,6 +104,19 @@ COLOR_GROUP_POSITIONS: dict[ColorGroup, list[int]] = {
     ColorGroup.DARK_BLUE: [37, 39],
 }
 
+# (price, mortgage_value, house_cost) for every ownable position
+ASSET_VALUES: dict[int, tuple[int, int, int]] = {
+    **{pos: (p.price, p.mortgage_value, p.house_cost) for pos, p in PROPERTIES.items()},
+    **{pos: (r.price, r.mortgage_value, 0) for pos, r in RAILROADS.items()},
+    **{pos: (u.price, u.mortgage_value, 0) for pos, u in UTILITIES.items()},
+}
+
+# Attach each property's color group so rule checks skip the group lookup
+PROPERTIES.update({
+    pos: replace(prop, group_positions=tuple(COLOR_GROUP_POSITIONS[prop.color_group]))
+    for pos, prop in PROPERTIES.items()
+})
+
 BOARD_SIZE = 40
 
 
@@ -168,32 +187,78 @@ def _build_spaces() -> list[Space]:
     return spaces
 
 
+# Spaces are frozen dataclasses, so every Board shares one immutable layout
+_SPACES: tuple[Space, ...] = tuple(_build_spaces())
+
+
+# ── Flat per-position lookup tables ──────────────────────────────────────────
+# Parallel arrays over the 40 positions for hot-path checks that would
+# otherwise go through a Space object and its SpaceType enum.
+
+_PURCHASABLE_TYPES = (SpaceType.PROPERTY, SpaceType.RAILROAD, SpaceType.UTILITY)
+
+_TYPE_BYTES = bytes(space.space_type.value for space in _SPACES)
+
+_PURCHASABLE_MASK = bytes(
+    1 if SpaceType(value) in _PURCHASABLE_TYPES else 0 for value in _TYPE_BYTES
+)
+
+# Ownable data by position (None where the space isn't that kind)
+_PROPERTY_BY_POS: tuple[PropertyData | None, ...] = tuple(PROPERTIES.get(pos) for pos in range(BOARD_SIZE))
+_RAILROAD_BY_POS: tuple[RailroadData | None, ...] = tuple(RAILROADS.get(pos) for pos in range(BOARD_SIZE))
+_UTILITY_BY_POS: tuple[UtilityData | None, ...] = tuple(UTILITIES.get(pos) for pos in range(BOARD_SIZE))
+
+# A tuple rather than an array: indexing hands back the stored int instead of boxing a new one
+_PRICES: tuple[int, ...] = tuple(
+    (_PROPERTY_BY_POS[pos] or _RAILROAD_BY_POS[pos] or _UTILITY_BY_POS[pos]).price
+    if _PURCHASABLE_MASK[pos] else 0
+    for pos in range(BOARD_SIZE)
+)
+
+# Next railroad / utility strictly ahead of each position, wrapping past GO
+_RAILROAD_POSITIONS = tuple(sorted(RAILROADS))  # (5, 15, 25, 35)
+_UTILITY_POSITIONS = tuple(sorted(UTILITIES))  # (12, 28)
+
+_NEAREST_RAILROAD = tuple(
+    next((rr for rr in _RAILROAD_POSITIONS if rr > pos), _RAILROAD_POSITIONS[0])
+    for pos in range(BOARD_SIZE)
+)
+_NEAREST_UTILITY = tuple(
+    next((util for util in _UTILITY_POSITIONS if util > pos), _UTILITY_POSITIONS[0])
+    for pos in range(BOARD_SIZE)
+)
+
+
 class Board:
     """The Monopoly game board with all 40 spaces."""
 
     def __init__(self) -> None:
-        self.spaces: list[Space] = _build_spaces()
+        self.spaces: tuple[Space, ...] = _SPACES
         self.size = BOARD_SIZE
 
     def get_space(self, position: int) -> Space:
         """Get the space at a given position (0-39)."""
         return self.spaces[position % self.size]
 
+    def get_space_unchecked(self, position: int) -> Space:
+        """Get the space at a position already known to be in 0-39, without wrapping."""
+        return self.spaces[position]
+
     def get_color_group(self, color: ColorGroup) -> list[int]:
         """Get all property positions in a color group."""
         return COLOR_GROUP_POSITIONS[color]
 
     def get_property_data(self, position: int) -> PropertyData | None:
         """Get property data for a position, or None if not a property."""
-        return PROPERTIES.get(position)
+        return _PROPERTY_BY_POS[position]
 
     def get_railroad_data(self, position: int) -> RailroadData | None:
         """Get railroad data for a position, or None if not a railroad."""
-        return RAILROADS.get(position)
+        return _RAILROAD_BY_POS[position]
 
     def get_utility_data(self, position: int) -> UtilityData | None:
         """Get utility data for a position, or None if not a utility."""
-        return UTILITIES.get(position)
+        return _UTILITY_BY_POS[position]
 
     def distance_to(self, from_pos: int, to_pos: int) -> int:
         """Calculate clockwise distance from one position to another."""
@@ -201,31 +266,16 @@ class Board:
 
     def get_nearest_railroad(self, position: int) -> int:
         """Get the position of the nearest railroad ahead of the given position."""
-        railroad_positions = sorted(RAILROADS.keys())  # [5, 15, 25, 35]
-        for rr in railroad_positions:
-            if rr > position:
-                return rr
-        return railroad_positions[0]  # wrap around to Reading Railroad
+        return _NEAREST_RAILROAD[position]
 
     def get_nearest_utility(self, position: int) -> int:
         """Get the position of the nearest utility ahead of the given position."""
-        utility_positions = sorted(UTILITIES.keys())  # [12, 28]
-        for util in utility_positions:
-            if util > position:
-                return util
-        return utility_positions[0]  # wrap around to Electric Company
+        return _NEAREST_UTILITY[position]
 
     def is_purchasable(self, position: int) -> bool:
         """Check if a space can be purchased."""
-        space = self.get_space(position)
-        return space.space_type in (SpaceType.PROPERTY, SpaceType.RAILROAD, SpaceType.UTILITY)
+        return bool(_PURCHASABLE_MASK[position % BOARD_SIZE])
 
     def get_purchase_price(self, position: int) -> int:
         """Get the purchase price for a buyable space."""
-        if position in PROPERTIES:
-            return PROPERTIES[position].price
-        if position in RAILROADS:
-            return RAILROADS[position].price
-        if position in UTILITIES:
-            return UTILITIES[position].price
-        return 0
+        return _PRICES[position] if 0 <= position < BOARD_SIZE else 0
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 
-from monopoly.engine.types import Card, CardEffect, CardEffectType, CardType
+from monopoly.engine.types import Card, CardEffect, CardEffectType, CardType, TargetType
 
 
 def _build_chance_cards() -> list[Card]:
@@ -24,13 +24,13 @@ def _build_chance_cards() -> list[Card]:
             CardEffectType.ADVANCE_TO, destination=11)),
         Card(CardType.CHANCE, CardEffect(
             "Advance to the nearest Railroad. Pay owner twice the rental",
-            CardEffectType.ADVANCE_TO_NEAREST, target_type="railroad")),
+            CardEffectType.ADVANCE_TO_NEAREST, target_type=TargetType.RAILROAD)),
         Card(CardType.CHANCE, CardEffect(
             "Advance to the nearest Railroad. Pay owner twice the rental",
-            CardEffectType.ADVANCE_TO_NEAREST, target_type="railroad")),
+            CardEffectType.ADVANCE_TO_NEAREST, target_type=TargetType.RAILROAD)),
         Card(CardType.CHANCE, CardEffect(
             "Advance to the nearest Utility. If unowned, buy it. If owned, roll dice and pay 10x",
-            CardEffectType.ADVANCE_TO_NEAREST, target_type="utility")),
+            CardEffectType.ADVANCE_TO_NEAREST, target_type=TargetType.UTILITY)),
         Card(CardType.CHANCE, CardEffect(
             "Bank pays you dividend of $50",
             CardEffectType.COLLECT, value=50)),
@@ -118,9 +118,12 @@ def _build_community_chest_cards() -> list[Card]:
 class Deck:
     """A shuffleable card deck."""
 
+    __slots__ = ("_cards", "_draw_pile", "_cursor", "_rng", "_jail_card_held")
+
     def __init__(self, cards: list[Card], seed: int | None = None) -> None:
         self._cards = list(cards)
         self._draw_pile: list[Card] = []
+        self._cursor = 0  # Index of the top card in _draw_pile
         self._rng = random.Random(seed)
         self._jail_card_held = False
         self.shuffle()
@@ -129,10 +132,11 @@ class Deck:
         """Shuffle all cards back into the draw pile."""
         self._draw_pile = list(self._cards)
         self._rng.shuffle(self._draw_pile)
+        self._cursor = 0
 
     def draw(self) -> Card:
         """Draw the top card. If empty, reshuffle (minus held jail cards)."""
-        if not self._draw_pile:
+        if self._cursor == len(self._draw_pile):
             # Reshuffle, excluding Get Out of Jail Free cards that are held
             available = [
                 c for c in self._cards
@@ -141,8 +145,12 @@ class Deck:
             ]
             self._draw_pile = list(available)
             self._rng.shuffle(self._draw_pile)
+            self._cursor = 0
 
-        return self._draw_pile.pop(0)
+        # Advance a cursor instead of pop(0), which shifts the whole list
+        card = self._draw_pile[self._cursor]
+        self._cursor += 1
+        return card
 
     def return_jail_card(self) -> None:
         """Return a Get Out of Jail Free card to the deck."""
@@ -154,7 +162,7 @@ class Deck:
 
     @property
     def cards_remaining(self) -> int:
-        return len(self._draw_pile)
+        return len(self._draw_pile) - self._cursor
 
 
 def create_chance_deck(seed: int | None = None) -> Deck:
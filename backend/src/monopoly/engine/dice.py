@@ -3,18 +3,47 @@
 from __future__ import annotations
 
 import random
+from typing import TYPE_CHECKING, Any
 
 from monopoly.engine.types import DiceRoll
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class Dice:
     """Two six-sided dice with injectable RNG."""
 
     def __init__(self, seed: int | None = None) -> None:
         self._rng = random.Random(seed)
+        self._seed = seed
+        self._np_rng: Any = None  # numpy Generator, created on first bulk_roll
 
     def roll(self) -> DiceRoll:
         """Roll two dice and return the result."""
-        die1 = self._rng.randint(1, 6)
-        die2 = self._rng.randint(1, 6)
+        # randrange(1, 7) is what randint(1, 6) calls, minus the wrapper, so
+        # seeded games roll exactly the same values
+        randrange = self._rng.randrange
+        die1 = randrange(1, 7)
+        die2 = randrange(1, 7)
         return DiceRoll(die1=die1, die2=die2)
+
+    def bulk_roll(self, n: int) -> np.ndarray:
+        """Roll two dice n times at once for bulk simulation.
+
+        Requires numpy (the ``sim`` extra). Uses its own numpy generator seeded
+        like this Dice, so it does not advance the sequence used by roll().
+
+        Args:
+            n: Number of rolls
+
+        Returns:
+            int8 array of shape (n, 2) with one row of (die1, die2) per roll
+        """
+        if self._np_rng is None:
+            try:
+                import numpy as np
+            except ImportError as e:
+                raise ImportError("Dice.bulk_roll requires numpy: pip install 'monopoly-agents[sim]'") from e
+            self._np_rng = np.random.default_rng(self._seed)
+        return self._np_rng.integers(1, 7, size=(n, 2), dtype="int8")
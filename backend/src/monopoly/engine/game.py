@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from array import array
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 
 from monopoly.engine.bank import Bank
-from monopoly.engine.board import Board, PROPERTIES, RAILROADS, UTILITIES, COLOR_GROUP_POSITIONS
+from monopoly.engine.board import BOARD_SIZE, Board, PROPERTIES, RAILROADS, UTILITIES, COLOR_GROUP_POSITIONS
 from monopoly.engine.cards import Deck, create_chance_deck, create_community_chest_deck
 from monopoly.engine.dice import Dice
 from monopoly.engine.player import Player
@@ -20,6 +22,7 @@ from monopoly.engine.types import (
     GamePhase,
     JailAction,
     SpaceType,
+    TargetType,
     TradeProposal,
     TurnPhase,
 )
@@ -30,7 +33,7 @@ JAIL_FINE = 50
 MAX_JAIL_TURNS = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class LandingResult:
     """Result of landing on a space — what action is needed."""
     space_type: SpaceType
@@ -67,9 +70,28 @@ class Game:
         self.turn_phase: TurnPhase = TurnPhase.PRE_ROLL
         self.last_roll: DiceRoll | None = None
         self.events: list[GameEvent] = []
-
-        # Property ownership tracking: position -> player_id (or -1 if unowned)
-        self._property_owners: dict[int, int] = {}
+        self._emit_enabled: bool = True  # False while inside silent()
+
+        # Property ownership tracking: owner player_id per board position (-1 if unowned)
+        self._property_owners: array = array("b", [-1]) * BOARD_SIZE
+
+        # Board spaces by position, indexed directly on the landing path
+        self._spaces = self.board.spaces
+
+        # Landing handler per board position (None for spaces with no action).
+        # Plain functions rather than bound methods, so the table doesn't
+        # create a reference cycle back to the game.
+        cls = type(self)
+        handlers = {
+            SpaceType.PROPERTY: cls._handle_ownable_landing,
+            SpaceType.RAILROAD: cls._handle_ownable_landing,
+            SpaceType.UTILITY: cls._handle_ownable_landing,
+            SpaceType.TAX: cls._handle_tax,
+            SpaceType.CHANCE: cls._handle_chance,
+            SpaceType.COMMUNITY_CHEST: cls._handle_community_chest,
+            SpaceType.GO_TO_JAIL: cls._handle_go_to_jail,
+        }
+        self._landing_handlers = tuple(handlers.get(space.space_type) for space in self._spaces)
 
     # ── Property ownership ──────────────────────────────────────────────
 
@@ -79,14 +101,16 @@ class Game:
 
     def get_property_owner(self, position: int) -> Player | None:
         """Get the player who owns a property, or None."""
-        owner_id = self._property_owners.get(position, -1)
-        if owner_id == -1:
-            return None
-        return self.players[owner_id]
+        owner_id = self._property_owners[position]
+        return None if owner_id < 0 else self.players[owner_id]
 
     def is_property_owned(self, position: int) -> bool:
         """Check if a property position is owned by any player."""
-        return position in self._property_owners
+        return self._property_owners[position] >= 0
+
+    def get_property_ownership(self) -> dict[int, int]:
+        """Get a position -> player_id map of all owned properties."""
+        return {pos: owner_id for pos, owner_id in enumerate(self._property_owners) if owner_id >= 0}
 
     def assign_property(self, player: Player, position: int) -> None:
         """Assign a property to a player."""
@@ -101,7 +125,8 @@ class Game:
 
     def unown_property(self, position: int) -> None:
         """Remove ownership of a property (for bankruptcy to bank)."""
-        self._property_owners.pop(position, None)
+        if 0 <= position < BOARD_SIZE:
+            self._property_owners[position] = -1
 
     # ── Dice rolling ────────────────────────────────────────────────────
 
@@ -147,62 +172,29 @@ class Game:
 
     def process_landing(self, player: Player) -> LandingResult:
         """Process landing on a space. Returns what action is needed."""
-        space = self.board.get_space(player.position)
-        result = LandingResult(space_type=space.space_type, position=player.position)
-
-        if space.space_type == SpaceType.PROPERTY:
-            self._handle_property_landing(player, result)
-        elif space.space_type == SpaceType.RAILROAD:
-            self._handle_railroad_landing(player, result)
-        elif space.space_type == SpaceType.UTILITY:
-            self._handle_utility_landing(player, result)
-        elif space.space_type == SpaceType.TAX:
-            self._handle_tax(player, space, result)
-        elif space.space_type == SpaceType.CHANCE:
-            self._handle_card(player, self.chance_deck, result)
-        elif space.space_type == SpaceType.COMMUNITY_CHEST:
-            self._handle_card(player, self.community_chest_deck, result)
-        elif space.space_type == SpaceType.GO_TO_JAIL:
-            self._send_to_jail(player)
-            result.sent_to_jail = True
-
-        return result
-
-    def _handle_property_landing(self, player: Player, result: LandingResult) -> None:
-        """Handle landing on a property space."""
-        pos = player.position
-        owner = self.get_property_owner(pos)
-
-        if owner is None:
-            result.requires_buy_decision = True
-        elif owner.player_id != player.player_id and not owner.is_mortgaged(pos):
-            rent = self.rules.calculate_rent(pos, owner, self.last_roll)
-            result.rent_owed = rent
-            result.rent_to_player = owner.player_id
+        position = player.position
+        space = self._spaces[position]
+        result = LandingResult(space_type=space.space_type, position=position)
 
-    def _handle_railroad_landing(self, player: Player, result: LandingResult) -> None:
-        """Handle landing on a railroad."""
-        pos = player.position
-        owner = self.get_property_owner(pos)
+        handler = self._landing_handlers[position]
+        if handler is not None:
+            handler(self, player, space, result)
 
-        if owner is None:
-            result.requires_buy_decision = True
-        elif owner.player_id != player.player_id and not owner.is_mortgaged(pos):
-            rent = self.rules.calculate_rent(pos, owner)
-            result.rent_owed = rent
-            result.rent_to_player = owner.player_id
+        return result
 
-    def _handle_utility_landing(self, player: Player, result: LandingResult) -> None:
-        """Handle landing on a utility."""
+    def _handle_ownable_landing(self, player: Player, space, result: LandingResult) -> None:
+        """Handle landing on a property, railroad, or utility."""
         pos = player.position
-        owner = self.get_property_owner(pos)
+        owner_id = self._property_owners[pos]
 
-        if owner is None:
+        if owner_id < 0:
             result.requires_buy_decision = True
-        elif owner.player_id != player.player_id and not owner.is_mortgaged(pos):
-            rent = self.rules.calculate_rent(pos, owner, self.last_roll)
-            result.rent_owed = rent
-            result.rent_to_player = owner.player_id
+        elif owner_id != player.player_id:
+            owner = self.players[owner_id]
+            if not owner.is_mortgaged(pos):
+                # Only utility rent reads the roll; property and railroad rent ignore it
+                result.rent_owed = self.rules.calculate_rent(pos, owner, self.last_roll)
+                result.rent_to_player = owner_id
 
     def _handle_tax(self, player: Player, space, result: LandingResult) -> None:
         """Handle landing on a tax space."""
@@ -213,6 +205,19 @@ class Game:
             "amount": tax, "space": space.name,
         })
 
+    def _handle_chance(self, player: Player, space, result: LandingResult) -> None:
+        """Handle landing on a Chance space."""
+        self._handle_card(player, self.chance_deck, result)
+
+    def _handle_community_chest(self, player: Player, space, result: LandingResult) -> None:
+        """Handle landing on a Community Chest space."""
+        self._handle_card(player, self.community_chest_deck, result)
+
+    def _handle_go_to_jail(self, player: Player, space, result: LandingResult) -> None:
+        """Handle landing on Go To Jail."""
+        self._send_to_jail(player)
+        result.sent_to_jail = True
+
     def _handle_card(self, player: Player, deck: Deck, result: LandingResult) -> None:
         """Handle drawing a Chance or Community Chest card."""
         card = deck.draw()
@@ -233,23 +238,20 @@ class Game:
         if effect.effect_type == CardEffectType.ADVANCE_TO:
             collect_go = effect.destination != 10  # Don't collect GO if going to jail
             self.move_player_to(player, effect.destination, collect_go=collect_go)
-            # Process the new landing
-            new_result = self.process_landing(player)
-            if new_result.rent_owed > 0:
-                self.pay_rent(player, new_result.rent_to_player, new_result.rent_owed)
+            self._land_after_card_move(player)
 
         elif effect.effect_type == CardEffectType.ADVANCE_TO_NEAREST:
-            if effect.target_type == "railroad":
+            if effect.target_type is TargetType.RAILROAD:
                 target = self.board.get_nearest_railroad(player.position)
                 self.move_player_to(player, target)
                 owner = self.get_property_owner(target)
                 if owner is not None and owner.player_id != player.player_id:
                     # Pay double railroad rent
                     rent = self.rules.calculate_rent(target, owner) * 2
-                    self.pay_rent(player, owner.player_id, rent)
+                    self._pay_rent_to(player, owner, rent)
                 elif owner is None:
                     pass  # Landing result will handle buy decision on next check
-            elif effect.target_type == "utility":
+            elif effect.target_type is TargetType.UTILITY:
                 target = self.board.get_nearest_utility(player.position)
                 self.move_player_to(player, target)
                 owner = self.get_property_owner(target)
@@ -257,18 +259,18 @@ class Game:
                     # Roll dice and pay 10x
                     roll = self.roll_dice()
                     rent = roll.total * 10
-                    self.pay_rent(player, owner.player_id, rent)
+                    self._pay_rent_to(player, owner, rent)
 
         elif effect.effect_type == CardEffectType.GO_BACK:
-            new_pos = (player.position - effect.value) % 40
+            # Card values are far smaller than the board, so one wrap suffices
+            new_pos = player.position - effect.value
+            if new_pos < 0:
+                new_pos += BOARD_SIZE
             player.position = new_pos
             self._emit(EventType.PLAYER_MOVED, player_id=player.player_id, data={
                 "new_position": new_pos, "went_back": effect.value,
             })
-            # Process landing on the new space
-            new_result = self.process_landing(player)
-            if new_result.rent_owed > 0:
-                self.pay_rent(player, new_result.rent_to_player, new_result.rent_owed)
+            self._land_after_card_move(player)
 
         elif effect.effect_type == CardEffectType.COLLECT:
             player.add_cash(effect.value)
@@ -277,28 +279,30 @@ class Game:
             player.remove_cash(effect.value)
 
         elif effect.effect_type == CardEffectType.PAY_EACH_PLAYER:
-            active_players = [p for p in self.players if not p.is_bankrupt]
-            for other in active_players:
-                if other.player_id != player.player_id:
-                    player.remove_cash(effect.value)
-                    other.add_cash(effect.value)
+            # Paid one player at a time: remove_cash refuses a payment the
+            # player can't cover, so a lump sum would change the outcome.
+            amount = effect.value
+            for other in self._other_active_players(player):
+                player.remove_cash(amount)
+                other.add_cash(amount)
 
         elif effect.effect_type == CardEffectType.COLLECT_FROM_EACH:
-            active_players = [p for p in self.players if not p.is_bankrupt]
-            for other in active_players:
-                if other.player_id != player.player_id:
-                    other.remove_cash(effect.value)
-                    player.add_cash(effect.value)
+            amount = effect.value
+            for other in self._other_active_players(player):
+                other.remove_cash(amount)
+                player.add_cash(amount)
 
         elif effect.effect_type == CardEffectType.REPAIRS:
-            total_cost = 0
-            for pos in player.properties:
-                houses = player.get_house_count(pos)
-                if houses == 5:  # hotel
-                    total_cost += effect.per_hotel
-                elif houses > 0:
-                    total_cost += effect.per_house * houses
-            player.remove_cash(total_cost)
+            # player.houses only holds developed properties, so undeveloped
+            # ones are never visited
+            hotels = 0
+            houses = 0
+            for count in player.houses.values():
+                if count == 5:  # hotel
+                    hotels += 1
+                else:
+                    houses += count
+            player.remove_cash(effect.per_house * houses + effect.per_hotel * hotels)
 
         elif effect.effect_type == CardEffectType.GO_TO_JAIL:
             self._send_to_jail(player)
@@ -307,32 +311,43 @@ class Game:
             player.get_out_of_jail_cards += 1
             deck.remove_jail_card()
 
+    def _land_after_card_move(self, player: Player) -> None:
+        """Process landing where a card moved the player, settling any rent at once."""
+        # Cards can chain (GO_BACK onto Community Chest), but only a bounded
+        # number of times, so plain recursion through process_landing is kept
+        result = self.process_landing(player)
+        if result.rent_owed > 0:
+            self._pay_rent_to(player, self.players[result.rent_to_player], result.rent_owed)
+
     # ── Rent payment ────────────────────────────────────────────────────
 
     def pay_rent(self, payer: Player, owner_id: int, amount: int) -> None:
         """Process rent payment from one player to another."""
-        owner = self.players[owner_id]
+        self._pay_rent_to(payer, self.players[owner_id], amount)
+
+    def _pay_rent_to(self, payer: Player, owner: Player, amount: int) -> None:
+        """Pay rent to an already-resolved owner."""
         payer.remove_cash(amount)
         owner.add_cash(amount)
-        self._emit(EventType.RENT_PAID, player_id=payer.player_id, data={
-            "amount": amount, "to_player": owner_id,
-        })
+        if self._emit_enabled:
+            self._emit(EventType.RENT_PAID, player_id=payer.player_id, data={
+                "amount": amount, "to_player": owner.player_id,
+            })
 
     # ── Buying and auctioning ───────────────────────────────────────────
 
     def buy_property(self, player: Player, position: int) -> bool:
         """Player buys a property at listed price. Returns success."""
+        # A non-zero price means the position is an in-range ownable space
         price = self.board.get_purchase_price(position)
-        if price == 0 or player.cash < price:
-            return False
-        if self.is_property_owned(position):
+        if price == 0 or self._property_owners[position] >= 0 or player.cash < price:
             return False
 
         player.remove_cash(price)
         self.assign_property(player, position)
         self._emit(EventType.PROPERTY_PURCHASED, player_id=player.player_id, data={
             "position": position, "price": price,
-            "name": self.board.get_space(position).name,
+            "name": self._spaces[position].name,
         })
         return True
 
@@ -342,18 +357,18 @@ class Game:
         if not bids:
             return None
 
-        # Filter valid bids (player must have enough cash)
-        valid_bids = {
-            pid: amount for pid, amount in bids.items()
-            if amount > 0 and self.players[pid].cash >= amount
-            and not self.players[pid].is_bankrupt
-        }
+        # Highest valid bid wins (player must have enough cash); ties go to
+        # the earliest bidder
+        winner_id, winning_bid = -1, 0
+        for pid, amount in bids.items():
+            if amount > winning_bid:
+                bidder = self.players[pid]
+                if bidder.cash >= amount and not bidder.is_bankrupt:
+                    winner_id, winning_bid = pid, amount
 
-        if not valid_bids:
+        if winner_id < 0:
             return None
 
-        winner_id = max(valid_bids, key=valid_bids.get)
-        winning_bid = valid_bids[winner_id]
         winner = self.players[winner_id]
 
         winner.remove_cash(winning_bid)
@@ -361,7 +376,7 @@ class Game:
 
         self._emit(EventType.AUCTION_WON, player_id=winner_id, data={
             "position": position, "bid": winning_bid,
-            "name": self.board.get_space(position).name,
+            "name": self._spaces[position].name,
         })
         return winner_id
 
@@ -540,12 +555,16 @@ class Game:
         events = execute_trade(proposal, proposer, receiver, self.rules)
 
         # Update property ownership tracking
+        owners = self._property_owners
+        receiver_id = receiver.player_id
+        proposer_id = proposer.player_id
         for pos in proposal.offered_properties:
-            self._property_owners[pos] = receiver.player_id
+            owners[pos] = receiver_id
         for pos in proposal.requested_properties:
-            self._property_owners[pos] = proposer.player_id
+            owners[pos] = proposer_id
 
-        self.events.extend(events)
+        if self._emit_enabled:
+            self.events.extend(events)
         return True, ""
 
     # ── Bankruptcy ──────────────────────────────────────────────────────
@@ -555,20 +574,20 @@ class Game:
         player.is_bankrupt = True
 
         if creditor_id is not None:
-            # Bankrupt to another player: transfer all assets
+            # Bankrupt to another player: transfer all assets. The player's
+            # own holdings are cleared wholesale below, so ownership moves
+            # across in bulk rather than property by property.
             creditor = self.players[creditor_id]
-            for pos in list(player.properties):
-                is_mortgaged = player.is_mortgaged(pos)
-                player.remove_property(pos)
-                creditor.add_property(pos)
-                self._property_owners[pos] = creditor.player_id
-                if is_mortgaged:
-                    creditor.mortgage_property(pos)
+            owners = self._property_owners
+            for pos in player.properties:
+                owners[pos] = creditor_id
+            creditor.add_properties(player.properties)
+            creditor.mortgaged.update(player.mortgaged.intersection(player.properties))
             creditor.add_cash(player.cash)
             creditor.get_out_of_jail_cards += player.get_out_of_jail_cards
         else:
             # Bankrupt to the bank: properties go to auction
-            for pos in list(player.properties):
+            for pos in player.properties:
                 # Return any buildings
                 houses = player.get_house_count(pos)
                 if houses == 5:
@@ -576,14 +595,11 @@ class Game:
                 else:
                     for _ in range(houses):
                         self.bank.return_house()
-                player.remove_property(pos)
-                self.unown_property(pos)
+                self._property_owners[pos] = -1
 
         player.cash = 0
         player.get_out_of_jail_cards = 0
-        player.properties.clear()
-        player.houses.clear()
-        player.mortgaged.clear()
+        player.clear_properties()
 
         self._emit(EventType.PLAYER_BANKRUPT, player_id=player.player_id, data={
             "creditor_id": creditor_id,
@@ -595,10 +611,16 @@ class Game:
         """Advance to the next player's turn."""
         self.turn_number += 1
         # Find next non-bankrupt player
-        for _ in range(len(self.players)):
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
-            if not self.current_player.is_bankrupt:
+        players = self.players
+        num_players = len(players)
+        index = self.current_player_index
+        for _ in range(num_players):
+            index += 1
+            if index == num_players:
+                index = 0
+            if not players[index].is_bankrupt:
                 break
+        self.current_player_index = index
 
         self.turn_phase = TurnPhase.PRE_ROLL
         self._emit(EventType.TURN_STARTED, player_id=self.current_player.player_id, data={
@@ -607,24 +629,51 @@ class Game:
 
     def is_over(self) -> bool:
         """Check if the game is over (only 1 player remaining)."""
-        active = [p for p in self.players if not p.is_bankrupt]
-        return len(active) <= 1
+        # Stop as soon as a second active player is seen
+        found_active = False
+        for p in self.players:
+            if not p.is_bankrupt:
+                if found_active:
+                    return False
+                found_active = True
+        return True
 
     def get_winner(self) -> Player | None:
         """Get the winning player, or None if game isn't over."""
         if not self.is_over():
             return None
-        active = [p for p in self.players if not p.is_bankrupt]
-        return active[0] if active else None
+        return next((p for p in self.players if not p.is_bankrupt), None)
 
     def get_active_players(self) -> list[Player]:
         """Get all non-bankrupt players."""
         return [p for p in self.players if not p.is_bankrupt]
 
+    def _other_active_players(self, player: Player) -> list[Player]:
+        """Get all non-bankrupt players except the given one."""
+        return [p for p in self.players if p is not player and not p.is_bankrupt]
+
     # ── Event system ────────────────────────────────────────────────────
 
+    @contextmanager
+    def silent(self) -> Iterator[None]:
+        """
+        Suppress event recording for the duration of the block.
+
+        For simulations that advance the game without anyone reading
+        self.events, so no GameEvent objects are built. Game state is
+        updated exactly as usual.
+        """
+        previous = self._emit_enabled
+        self._emit_enabled = False
+        try:
+            yield
+        finally:
+            self._emit_enabled = previous
+
     def _emit(self, event_type: EventType, player_id: int = -1, data: dict | None = None) -> None:
         """Emit a game event."""
+        if not self._emit_enabled:
+            return
         event = GameEvent(
             event_type=event_type,
             player_id=player_id,
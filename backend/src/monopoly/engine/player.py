@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+from monopoly.engine.board import ASSET_VALUES
+
 
 STARTING_CASH = 1500
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """A Monopoly player's mutable state."""
 
@@ -24,6 +26,11 @@ class Player:
     get_out_of_jail_cards: int = 0
     is_bankrupt: bool = False
     consecutive_doubles: int = 0
+    # Mirror of `properties` for O(1) membership checks; the list keeps purchase order
+    _property_set: set[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._property_set = set(self.properties)
 
     def add_cash(self, amount: int) -> None:
         """Add cash to the player."""
@@ -38,19 +45,52 @@ class Player:
 
     def add_property(self, position: int) -> None:
         """Add a property to the player's portfolio."""
-        if position not in self.properties:
+        if position not in self._property_set:
+            self._property_set.add(position)
             self.properties.append(position)
 
+    def add_properties(self, positions: list[int]) -> None:
+        """Add several properties to the player's portfolio at once."""
+        new = [pos for pos in positions if pos not in self._property_set]
+        self._property_set.update(new)
+        self.properties.extend(new)
+
     def remove_property(self, position: int) -> None:
         """Remove a property from the player's portfolio."""
-        if position in self.properties:
+        if position in self._property_set:
+            self._property_set.discard(position)
             self.properties.remove(position)
         self.mortgaged.discard(position)
         self.houses.pop(position, None)
 
+    def remove_properties(self, positions: list[int]) -> None:
+        """Remove several properties, with their buildings and mortgages, at once."""
+        removed = self._property_set.intersection(positions)
+        if removed:
+            self._property_set -= removed
+            self.properties[:] = [pos for pos in self.properties if pos not in removed]
+        self.mortgaged.difference_update(positions)
+        for pos in positions:
+            self.houses.pop(pos, None)
+
+    def clear_properties(self) -> None:
+        """Remove every property, along with its buildings and mortgages."""
+        self.properties.clear()
+        self._property_set.clear()
+        self.houses.clear()
+        self.mortgaged.clear()
+
     def owns_property(self, position: int) -> bool:
         """Check if the player owns a property at a given position."""
-        return position in self.properties
+        return position in self._property_set
+
+    def owns_all(self, positions) -> bool:
+        """Check if the player owns every one of the given positions."""
+        return self._property_set.issuperset(positions)
+
+    def count_unmortgaged(self, positions) -> int:
+        """Count how many of the given positions the player owns unmortgaged."""
+        return len(self._property_set.intersection(positions).difference(self.mortgaged))
 
     def mortgage_property(self, position: int) -> None:
         """Mark a property as mortgaged."""
@@ -102,25 +142,15 @@ class Player:
 
     def net_worth(self, board) -> int:
         """Calculate total net worth (cash + property values + building values)."""
-        from monopoly.engine.board import PROPERTIES, RAILROADS, UTILITIES
-
         total = self.cash
+        mortgaged = self.mortgaged
+        houses = self.houses
         for pos in self.properties:
-            if pos in PROPERTIES:
-                prop = PROPERTIES[pos]
-                if pos in self.mortgaged:
-                    total += prop.mortgage_value
-                else:
-                    total += prop.price
-                houses = self.get_house_count(pos)
-                if houses == 5:  # hotel
-                    total += prop.house_cost * 5  # 4 houses + 1 hotel cost
-                else:
-                    total += prop.house_cost * houses
-            elif pos in RAILROADS:
-                rr = RAILROADS[pos]
-                total += rr.mortgage_value if pos in self.mortgaged else rr.price
-            elif pos in UTILITIES:
-                util = UTILITIES[pos]
-                total += util.mortgage_value if pos in self.mortgaged else util.price
+            values = ASSET_VALUES.get(pos)
+            if values is None:  # not an ownable space
+                continue
+            price, mortgage_value, house_cost = values
+            total += mortgage_value if pos in mortgaged else price
+            # A hotel (5) is valued as 4 houses + 1 hotel, i.e. 5 * house_cost
+            total += house_cost * houses.get(pos, 0)
         return total
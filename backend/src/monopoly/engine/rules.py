@@ -3,17 +3,28 @@
 from __future__ import annotations
 
 from monopoly.engine.board import (
+    ASSET_VALUES,
     Board,
     COLOR_GROUP_POSITIONS,
     PROPERTIES,
-    RAILROAD_RENTS,
+    RAILROAD_RENT_TABLE,
     RAILROADS,
     UTILITIES,
-    UTILITY_MULTIPLIERS,
+    UTILITY_MULTIPLIER_TABLE,
 )
 from monopoly.engine.bank import Bank
 from monopoly.engine.player import Player
-from monopoly.engine.types import DiceRoll, SpaceType, TradeProposal
+from monopoly.engine.types import DiceRoll, PropertyData, SpaceType, TradeProposal
+
+
+# Railroad / utility positions as sets, for counting an owner's holdings
+_RAILROAD_SET = frozenset(RAILROADS)
+_UTILITY_SET = frozenset(UTILITIES)
+
+# Mortgage amounts per ownable position, derived once from the asset table
+_MORTGAGE_VALUES = {pos: mortgage_value for pos, (_, mortgage_value, _) in ASSET_VALUES.items()}
+_UNMORTGAGE_COSTS = {pos: int(value * 1.1) for pos, value in _MORTGAGE_VALUES.items()}  # + 10% interest
+_TRANSFER_FEES = {pos: int(value * 0.1) for pos, value in _MORTGAGE_VALUES.items()}  # 10% fee
 
 
 class Rules:
@@ -28,7 +39,7 @@ class Rules:
         self, position: int, owner: Player, dice_roll: DiceRoll | None = None
     ) -> int:
         """Calculate rent owed for landing on an owned property."""
-        if owner.is_mortgaged(position):
+        if position in owner.mortgaged:
             return 0
 
         space = self.board.get_space(position)
@@ -46,36 +57,34 @@ class Rules:
     def _property_rent(self, position: int, owner: Player) -> int:
         """Calculate rent for a standard property."""
         prop = PROPERTIES[position]
-        houses = owner.get_house_count(position)
+        houses = owner.houses.get(position, 0)
 
         if houses > 0:
             # rent tuple: (base, 1h, 2h, 3h, 4h, hotel)
             return prop.rent[houses]  # index 1-5
 
         # Unimproved: check for monopoly (double rent)
-        if self.has_monopoly(owner, prop.color_group):
+        if self._owns_group(owner, prop):
             return prop.rent[0] * 2
         return prop.rent[0]
 
     def _railroad_rent(self, owner: Player) -> int:
         """Calculate rent for a railroad based on how many the owner has."""
-        count = sum(1 for pos in RAILROADS if owner.owns_property(pos)
-                    and not owner.is_mortgaged(pos))
-        return RAILROAD_RENTS.get(count, 0)
+        return RAILROAD_RENT_TABLE[owner.count_unmortgaged(_RAILROAD_SET)]
 
     def _utility_rent(self, owner: Player, dice_roll: DiceRoll) -> int:
         """Calculate rent for a utility based on dice roll and count owned."""
-        count = sum(1 for pos in UTILITIES if owner.owns_property(pos)
-                    and not owner.is_mortgaged(pos))
-        multiplier = UTILITY_MULTIPLIERS.get(count, 0)
-        return dice_roll.total * multiplier
+        return dice_roll.total * UTILITY_MULTIPLIER_TABLE[owner.count_unmortgaged(_UTILITY_SET)]
 
     # ── Monopoly checks ────────────────────────────────────────────────
 
     def has_monopoly(self, player: Player, color_group) -> bool:
         """Check if a player owns all properties in a color group."""
-        positions = COLOR_GROUP_POSITIONS[color_group]
-        return all(player.owns_property(pos) for pos in positions)
+        return player.owns_all(COLOR_GROUP_POSITIONS[color_group])
+
+    def _owns_group(self, player: Player, prop: PropertyData) -> bool:
+        """has_monopoly for a property's own group, without the group lookup."""
+        return player.owns_all(prop.group_positions)
 
     # ── Building rules ──────────────────────────────────────────────────
 
@@ -86,16 +95,16 @@ class Rules:
         prop = PROPERTIES[position]
 
         # Must own full color group
-        if not self.has_monopoly(player, prop.color_group):
+        if not self._owns_group(player, prop):
             return False
 
         # No property in group can be mortgaged
-        group_positions = COLOR_GROUP_POSITIONS[prop.color_group]
-        if any(player.is_mortgaged(pos) for pos in group_positions):
+        group_positions = prop.group_positions
+        if not player.mortgaged.isdisjoint(group_positions):
             return False
 
         # Current house count
-        current = player.get_house_count(position)
+        current = player.houses.get(position, 0)
         if current >= 5:  # already has hotel
             return False
 
@@ -105,7 +114,7 @@ class Rules:
             return False
 
         for pos in group_positions:
-            if pos != position and player.get_house_count(pos) < current:
+            if pos != position and player.houses.get(pos, 0) < current:
                 return False
 
         # Must have enough cash
@@ -124,20 +133,20 @@ class Rules:
             return False
         prop = PROPERTIES[position]
 
-        if not self.has_monopoly(player, prop.color_group):
+        if not self._owns_group(player, prop):
             return False
 
-        group_positions = COLOR_GROUP_POSITIONS[prop.color_group]
-        if any(player.is_mortgaged(pos) for pos in group_positions):
+        group_positions = prop.group_positions
+        if not player.mortgaged.isdisjoint(group_positions):
             return False
 
-        current = player.get_house_count(position)
+        current = player.houses.get(position, 0)
         if current != 4:
             return False
 
         # Even build: all others must also have 4 houses or a hotel
         for pos in group_positions:
-            if pos != position and player.get_house_count(pos) < 4:
+            if pos != position and player.houses.get(pos, 0) < 4:
                 return False
 
         if player.cash < prop.house_cost:
@@ -153,16 +162,16 @@ class Rules:
         if position not in PROPERTIES:
             return False
         prop = PROPERTIES[position]
-        current = player.get_house_count(position)
+        current = player.houses.get(position, 0)
 
         if current <= 0 or current == 5:
             # Can't sell house from empty or hotel (must downgrade hotel first)
             return False
 
         # Even sell: can't sell if this property has fewer houses than others in group
-        group_positions = COLOR_GROUP_POSITIONS[prop.color_group]
+        group_positions = prop.group_positions
         for pos in group_positions:
-            if pos != position and player.get_house_count(pos) > current:
+            if pos != position and player.houses.get(pos, 0) > current:
                 return False
 
         return True
@@ -171,7 +180,7 @@ class Rules:
         """Check if a player can sell/downgrade a hotel."""
         if position not in PROPERTIES:
             return False
-        current = player.get_house_count(position)
+        current = player.houses.get(position, 0)
         if current != 5:
             return False
 
@@ -185,16 +194,14 @@ class Rules:
         """Check if a player can mortgage a property."""
         if not player.owns_property(position):
             return False
-        if player.is_mortgaged(position):
+        if position in player.mortgaged:
             return False
 
         # If it's a colored property, no buildings allowed on ANY property in the group
+        # (houses only holds non-zero counts, so its keys are the built positions)
         if position in PROPERTIES:
-            prop = PROPERTIES[position]
-            group_positions = COLOR_GROUP_POSITIONS[prop.color_group]
-            for pos in group_positions:
-                if player.get_house_count(pos) > 0:
-                    return False
+            if not player.houses.keys().isdisjoint(PROPERTIES[position].group_positions):
+                return False
 
         return True
 
@@ -202,7 +209,7 @@ class Rules:
         """Check if a player can unmortgage a property."""
         if not player.owns_property(position):
             return False
-        if not player.is_mortgaged(position):
+        if position not in player.mortgaged:
             return False
 
         # Calculate unmortgage cost (mortgage value + 10% interest)
@@ -211,18 +218,11 @@ class Rules:
 
     def unmortgage_cost(self, position: int) -> int:
         """Calculate the cost to unmortgage a property."""
-        mortgage_value = self._get_mortgage_value(position)
-        return int(mortgage_value * 1.1)
+        return _UNMORTGAGE_COSTS.get(position, 0)
 
     def _get_mortgage_value(self, position: int) -> int:
         """Get the mortgage value for a position."""
-        if position in PROPERTIES:
-            return PROPERTIES[position].mortgage_value
-        if position in RAILROADS:
-            return RAILROADS[position].mortgage_value
-        if position in UTILITIES:
-            return UTILITIES[position].mortgage_value
-        return 0
+        return _MORTGAGE_VALUES.get(position, 0)
 
     def get_mortgage_value(self, position: int) -> int:
         """Public accessor for mortgage value."""
@@ -244,19 +244,14 @@ class Rules:
     ) -> tuple[bool, str]:
         """Validate a trade proposal. Returns (is_valid, reason)."""
         # Check proposer owns offered properties
-        for pos in proposal.offered_properties:
-            if not proposer.owns_property(pos):
-                return False, f"Proposer doesn't own property at position {pos}"
-            # Can't trade properties with buildings
-            if proposer.get_house_count(pos) > 0:
-                return False, f"Must sell buildings before trading property at position {pos}"
+        reason = self._check_traded_properties(proposer, proposal.offered_properties, "Proposer")
+        if reason:
+            return False, reason
 
         # Check receiver owns requested properties
-        for pos in proposal.requested_properties:
-            if not receiver.owns_property(pos):
-                return False, f"Receiver doesn't own property at position {pos}"
-            if receiver.get_house_count(pos) > 0:
-                return False, f"Must sell buildings before trading property at position {pos}"
+        reason = self._check_traded_properties(receiver, proposal.requested_properties, "Receiver")
+        if reason:
+            return False, reason
 
         # Check cash
         if proposal.offered_cash > 0 and proposer.cash < proposal.offered_cash:
@@ -278,7 +273,21 @@ class Rules:
 
         return True, ""
 
+    def _check_traded_properties(self, player: Player, positions: list[int], role: str) -> str:
+        """Return why the player can't trade these properties, or "" if they can."""
+        # Common case: everything is owned and unbuilt, checked with two set operations
+        if player.owns_all(positions) and player.houses.keys().isdisjoint(positions):
+            return ""
+
+        # Otherwise walk the positions in order to report the first problem
+        for pos in positions:
+            if not player.owns_property(pos):
+                return f"{role} doesn't own property at position {pos}"
+            # Can't trade properties with buildings
+            if player.houses.get(pos, 0) > 0:
+                return f"Must sell buildings before trading property at position {pos}"
+        return ""
+
     def mortgage_transfer_fee(self, position: int) -> int:
         """Calculate the 10% transfer fee when trading a mortgaged property."""
-        mortgage_value = self._get_mortgage_value(position)
-        return int(mortgage_value * 0.1)
+        return _TRANSFER_FEES.get(position, 0)
@@ -21,43 +21,29 @@ def execute_trade(
     events: list[GameEvent] = []
 
     # Transfer properties from proposer to receiver
-    for pos in proposal.offered_properties:
-        is_mortgaged = proposer.is_mortgaged(pos)
-        proposer.remove_property(pos)
-        receiver.add_property(pos)
-        if is_mortgaged:
-            receiver.mortgage_property(pos)
-            # Receiver pays 10% transfer fee immediately
-            fee = rules.mortgage_transfer_fee(pos)
-            receiver.remove_cash(fee)
+    _transfer_properties(proposal.offered_properties, proposer, receiver, rules)
 
     # Transfer properties from receiver to proposer
-    for pos in proposal.requested_properties:
-        is_mortgaged = receiver.is_mortgaged(pos)
-        receiver.remove_property(pos)
-        proposer.add_property(pos)
-        if is_mortgaged:
-            proposer.mortgage_property(pos)
-            fee = rules.mortgage_transfer_fee(pos)
-            proposer.remove_cash(fee)
+    _transfer_properties(proposal.requested_properties, receiver, proposer, rules)
 
-    # Transfer cash
-    if proposal.offered_cash > 0:
-        proposer.remove_cash(proposal.offered_cash)
-        receiver.add_cash(proposal.offered_cash)
+    # Transfer cash. Each side goes through remove_cash, which refuses a
+    # payment the player can no longer cover after transfer fees, so the two
+    # amounts are not netted.
+    offered_cash = proposal.offered_cash
+    requested_cash = proposal.requested_cash
+    if offered_cash > 0:
+        proposer.remove_cash(offered_cash)
+        receiver.add_cash(offered_cash)
 
-    if proposal.requested_cash > 0:
-        receiver.remove_cash(proposal.requested_cash)
-        proposer.add_cash(proposal.requested_cash)
+    if requested_cash > 0:
+        receiver.remove_cash(requested_cash)
+        proposer.add_cash(requested_cash)
 
-    # Transfer Get Out of Jail Free cards
-    if proposal.offered_jail_cards > 0:
-        proposer.get_out_of_jail_cards -= proposal.offered_jail_cards
-        receiver.get_out_of_jail_cards += proposal.offered_jail_cards
-
-    if proposal.requested_jail_cards > 0:
-        receiver.get_out_of_jail_cards -= proposal.requested_jail_cards
-        proposer.get_out_of_jail_cards += proposal.requested_jail_cards
+    # Transfer Get Out of Jail Free cards (validated, so the net move is exact)
+    net_jail_cards = proposal.requested_jail_cards - proposal.offered_jail_cards
+    if net_jail_cards:
+        proposer.get_out_of_jail_cards += net_jail_cards
+        receiver.get_out_of_jail_cards -= net_jail_cards
 
     events.append(GameEvent(
         event_type=EventType.TRADE_ACCEPTED,
@@ -67,9 +53,25 @@ def execute_trade(
             "receiver_id": receiver.player_id,
             "offered_properties": proposal.offered_properties,
             "requested_properties": proposal.requested_properties,
-            "offered_cash": proposal.offered_cash,
-            "requested_cash": proposal.requested_cash,
+            "offered_cash": offered_cash,
+            "requested_cash": requested_cash,
         },
     ))
 
     return events
+
+
+def _transfer_properties(
+    positions: list[int], giver: Player, taker: Player, rules: Rules
+) -> None:
+    """Move properties between players; mortgages carry over with a transfer fee."""
+    if not positions:
+        return
+    mortgaged = giver.mortgaged.intersection(positions)
+    giver.remove_properties(positions)
+    taker.add_properties(positions)
+    if mortgaged:
+        taker.mortgaged |= mortgaged
+        # Taker pays the 10% transfer fee on each mortgaged property immediately
+        for pos in mortgaged:
+            taker.remove_cash(rules.mortgage_transfer_fee(pos))
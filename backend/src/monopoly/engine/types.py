@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Optional
 
 
@@ -39,6 +39,16 @@ class CardType(Enum):
     COMMUNITY_CHEST = auto()
 
 
+class TargetType(str, Enum):
+    """Destination kind for ADVANCE_TO_NEAREST cards.
+
+    Members compare equal to their string values, but the engine checks them
+    by identity.
+    """
+    RAILROAD = "railroad"
+    UTILITY = "utility"
+
+
 class CardEffectType(Enum):
     """Types of card effects."""
     ADVANCE_TO = auto()          # Move to a specific space
@@ -76,7 +86,7 @@ class GamePhase(Enum):
     FINISHED = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PropertyData:
     """Static data for a property space."""
     name: str
@@ -86,9 +96,11 @@ class PropertyData:
     mortgage_value: int
     rent: tuple[int, ...]  # (base, 1_house, 2_houses, 3_houses, 4_houses, hotel)
     house_cost: int
+    # Positions of every property in this color group, filled in by the board
+    group_positions: tuple[int, ...] = field(default=(), compare=False, repr=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RailroadData:
     """Static data for a railroad space."""
     name: str
@@ -97,7 +109,7 @@ class RailroadData:
     mortgage_value: int = 100
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UtilityData:
     """Static data for a utility space."""
     name: str
@@ -106,7 +118,7 @@ class UtilityData:
     mortgage_value: int = 75
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaxData:
     """Static data for a tax space."""
     name: str
@@ -114,7 +126,7 @@ class TaxData:
     amount: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Space:
     """A space on the Monopoly board."""
     position: int
@@ -126,41 +138,40 @@ class Space:
     tax_data: Optional[TaxData] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardEffect:
     """Effect of a Chance or Community Chest card."""
     description: str
     effect_type: CardEffectType
     value: int = 0               # Dollar amount or number of spaces
     destination: int = -1        # Target position for ADVANCE_TO
-    target_type: str = ""        # "railroad" or "utility" for ADVANCE_TO_NEAREST
+    target_type: TargetType | None = None  # For ADVANCE_TO_NEAREST
     per_house: int = 0           # For REPAIRS
     per_hotel: int = 0           # For REPAIRS
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     """A Chance or Community Chest card."""
     deck: CardType
     effect: CardEffect
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiceRoll:
     """Result of rolling two dice."""
     die1: int
     die2: int
+    # Derived once at construction; read on every move and utility rent
+    total: int = field(init=False, compare=False)
+    is_doubles: bool = field(init=False, compare=False)
 
-    @property
-    def total(self) -> int:
-        return self.die1 + self.die2
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "total", self.die1 + self.die2)
+        object.__setattr__(self, "is_doubles", self.die1 == self.die2)
 
-    @property
-    def is_doubles(self) -> bool:
-        return self.die1 == self.die2
 
-
-@dataclass
+@dataclass(slots=True)
 class TradeProposal:
     """A trade proposal between two players."""
     proposer_id: int
@@ -174,8 +185,12 @@ class TradeProposal:
 
 
 # Game event types for the event bus
-class EventType(Enum):
-    """Types of events emitted during gameplay."""
+class EventType(IntEnum):
+    """Types of events emitted during gameplay.
+
+    An IntEnum so subscriber lookups keyed by event type hash as plain ints.
+    Use ``.name`` when a readable label is needed; ``str()`` gives the number.
+    """
     GAME_STARTED = auto()
     TURN_STARTED = auto()
     DICE_ROLLED = auto()
@@ -205,7 +220,7 @@ class EventType(Enum):
     GAME_OVER = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEvent:
     """An event that occurred during the game."""
     event_type: EventType
@@ -1,6 +1,6 @@
 """Orchestrator layer for coordinating game execution and event distribution."""
 
-from monopoly.orchestrator.event_bus import EventBus, EventCallback, WILDCARD
+from monopoly.orchestrator.event_bus import EventBus, EventCallback, EventTap, WILDCARD
 from monopoly.orchestrator.turn_manager import TurnManager
 
-__all__ = ["EventBus", "EventCallback", "WILDCARD", "TurnManager"]
+__all__ = ["EventBus", "EventCallback", "EventTap", "WILDCARD", "TurnManager"]
@@ -6,6 +6,7 @@ to multiple consumers (e.g., WebSocket clients, logging systems, analytics).
 Key features:
 - Type-safe event subscriptions per EventType
 - Wildcard subscriptions (subscribe to all events)
+- Synchronous taps for consumers that record every event (e.g. history)
 - Thread-safe async event handling using asyncio
 - Automatic unsubscribe on consumer disconnect
 """
@@ -14,8 +15,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import defaultdict
-from typing import Callable, Awaitable
+from typing import Awaitable, Callable
 
 from monopoly.engine.types import EventType, GameEvent
 
@@ -25,9 +25,18 @@ logger = logging.getLogger(__name__)
 # Type alias for event callbacks
 EventCallback = Callable[[GameEvent], Awaitable[None]]
 
+# Type alias for synchronous taps
+EventTap = Callable[[GameEvent], None]
+
 # Sentinel value for wildcard subscriptions
 WILDCARD = "*"
 
+# String names accepted in place of an EventType, in upper and lower case
+_EVENT_TYPES_BY_NAME: dict[str, EventType] = {
+    **{member.name: member for member in EventType},
+    **{member.name.lower(): member for member in EventType},
+}
+
 
 class EventBus:
     """
@@ -36,20 +45,55 @@ class EventBus:
     The event bus maintains separate subscription lists for each event type,
     plus a wildcard subscription list for consumers that want all events.
 
-    Thread-safety is achieved through asyncio's event loop, which guarantees
-    that async operations are executed sequentially within a single thread.
+    No lock is needed: the bus is only used from its event loop's thread, and
+    the methods that change subscriptions (subscribe, unsubscribe, add_tap,
+    remove_tap, clear_all_subscribers) are plain synchronous calls, so each
+    change runs to completion without interleaving. Only emit() is awaited.
+
+    Subscribers are kept in insertion-ordered dicts for O(1) membership and
+    removal, mapping each callback to an exception-safe wrapper made once at
+    subscription. emit() never reads the dicts directly: it calls the wrappers
+    from tuples rebuilt on every change, which are never mutated in place, so it
+    keeps iterating a consistent snapshot across awaits.
+    Taps are copy-on-write tuples for the same reason.
     """
 
-    def __init__(self) -> None:
-        """Initialize the event bus with empty subscription lists."""
-        # Map of EventType -> list of callbacks
-        self._subscribers: dict[EventType, list[EventCallback]] = defaultdict(list)
-        # List of callbacks that receive all events
-        self._wildcard_subscribers: list[EventCallback] = []
-        # Lock for thread-safe modifications to subscriber lists
-        self._lock = asyncio.Lock()
+    def __init__(self, max_concurrency: int | None = None) -> None:
+        """
+        Initialize the event bus with empty subscription lists.
+
+        Args:
+            max_concurrency: If set, at most this many subscriber callbacks
+                run at once across all emits; the rest wait their turn. The
+                default (None) leaves fan-out unbounded.
 
-    async def subscribe(
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        # Shared by every callback wrapper when fan-out is bounded
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        # Map of EventType -> {callback: safe wrapper}, in subscription order
+        # (one entry per EventType, allocated up front)
+        self._subscribers: dict[EventType, dict[EventCallback, EventCallback]] = {
+            event_type: {} for event_type in EventType
+        }
+        # Callbacks that receive all events, likewise mapped to their wrappers
+        self._wildcard_subscribers: dict[EventCallback, EventCallback] = {}
+        # Synchronous callbacks run inline for every event
+        self._taps: tuple[EventTap, ...] = ()
+        # Per-type wrappers followed by the wildcard ones for every EventType,
+        # rebuilt whenever subscriptions change
+        self._dispatch: dict[EventType, tuple[EventCallback, ...]] = {
+            event_type: () for event_type in EventType
+        }
+        # Total subscriptions across all types and wildcard
+        self._total_count = 0
+        # Callback tasks started by emit_nowait(), referenced until they finish
+        self._pending: set[asyncio.Task] = set()
+
+    def subscribe(
         self,
         event_type: EventType | str,
         callback: EventCallback,
@@ -67,20 +111,18 @@ class EventBus:
             async def handle_dice_roll(event: GameEvent):
                 print(f"Dice rolled: {event.data}")
 
-            await bus.subscribe(EventType.DICE_ROLLED, handle_dice_roll)
+            bus.subscribe(EventType.DICE_ROLLED, handle_dice_roll)
         """
-        async with self._lock:
-            if event_type == WILDCARD:
-                if callback not in self._wildcard_subscribers:
-                    self._wildcard_subscribers.append(callback)
-            else:
-                if isinstance(event_type, str):
-                    # Convert string to EventType if needed
-                    event_type = EventType[event_type.upper()]
-                if callback not in self._subscribers[event_type]:
-                    self._subscribers[event_type].append(callback)
+        if event_type == WILDCARD:
+            callbacks = self._wildcard_subscribers
+        else:
+            callbacks = self._subscribers[_coerce_event_type(event_type)]
+        if callback not in callbacks:
+            callbacks[callback] = _safe_callback(callback, self._semaphore)
+            self._total_count += 1
+            self._rebuild_dispatch()
 
-    async def unsubscribe(
+    def unsubscribe(
         self,
         event_type: EventType | str,
         callback: EventCallback,
@@ -96,16 +138,39 @@ class EventBus:
             If the callback was not subscribed, this method does nothing.
             It's safe to call unsubscribe multiple times with the same callback.
         """
-        async with self._lock:
-            if event_type == WILDCARD:
-                if callback in self._wildcard_subscribers:
-                    self._wildcard_subscribers.remove(callback)
-            else:
-                if isinstance(event_type, str):
-                    event_type = EventType[event_type.upper()]
-                if event_type in self._subscribers:
-                    if callback in self._subscribers[event_type]:
-                        self._subscribers[event_type].remove(callback)
+        if event_type == WILDCARD:
+            callbacks = self._wildcard_subscribers
+        else:
+            callbacks = self._subscribers[_coerce_event_type(event_type)]
+        if callbacks.pop(callback, None) is not None:
+            self._total_count -= 1
+            self._rebuild_dispatch()
+
+    def add_tap(self, tap: EventTap) -> None:
+        """
+        Register a synchronous callback that is run inline for every event.
+
+        Taps bypass the async dispatch (no coroutine or gather per event) and
+        run before any subscriber, in registration order. They are meant for
+        cheap, non-blocking consumers that need every event, such as the event
+        history recorder.
+
+        Args:
+            tap: A plain function that accepts a GameEvent. Exceptions are
+                 logged and do not affect other taps or subscribers.
+        """
+        if tap not in self._taps:
+            self._taps += (tap,)
+
+    def remove_tap(self, tap: EventTap) -> None:
+        """
+        Remove a previously registered tap. Does nothing if it isn't registered.
+
+        Args:
+            tap: The tap function to remove.
+        """
+        if tap in self._taps:
+            self._taps = _without(self._taps, tap)
 
     async def emit(self, event: GameEvent) -> None:
         """
@@ -113,7 +178,7 @@ class EventBus:
 
         This method invokes all callbacks registered for the event's type,
         plus all wildcard subscribers. Callbacks are executed concurrently
-        using asyncio.gather().
+        using asyncio.gather(); a lone callback is awaited directly.
 
         Args:
             event: The GameEvent to broadcast.
@@ -132,49 +197,81 @@ class EventBus:
             )
             await bus.emit(event)
         """
-        # Gather all callbacks that should receive this event
-        callbacks_to_invoke: list[EventCallback] = []
+        self._run_taps(event)
+
+        # All callbacks that should receive this event, precomputed. The
+        # tuples are never mutated in place, so they stay valid across awaits.
+        callbacks_to_invoke = self._dispatch[event.event_type]
 
-        async with self._lock:
-            # Add type-specific subscribers
-            if event.event_type in self._subscribers:
-                callbacks_to_invoke.extend(self._subscribers[event.event_type])
-            # Add wildcard subscribers
-            callbacks_to_invoke.extend(self._wildcard_subscribers)
+        # Common cases: nobody listening, or a single subscriber awaited
+        # directly without the Task and future that gather() would create
+        if not callbacks_to_invoke:
+            return
+        if len(callbacks_to_invoke) == 1:
+            await callbacks_to_invoke[0](event)
+            return
 
         # Invoke all callbacks concurrently
-        if callbacks_to_invoke:
-            # Create tasks for all callbacks
-            tasks = [self._safe_invoke(callback, event) for callback in callbacks_to_invoke]
-            # Wait for all callbacks to complete (or fail)
-            await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [callback(event) for callback in callbacks_to_invoke]
+        # Wait for all callbacks to complete (or fail)
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _safe_invoke(self, callback: EventCallback, event: GameEvent) -> None:
+    def emit_nowait(self, event: GameEvent) -> None:
         """
-        Invoke a callback with exception handling.
+        Emit an event without waiting for subscribers to finish.
 
-        This wrapper ensures that exceptions in one callback don't affect others.
-        Exceptions are logged but not re-raised.
+        Taps run inline as in emit(); each subscriber is then scheduled as its
+        own task on the running loop, so the caller never waits on the slowest
+        subscriber. The bus holds a reference to every task until it is done.
 
         Args:
-            callback: The callback to invoke.
-            event: The event to pass to the callback.
-        """
-        try:
-            await callback(event)
-        except Exception as e:
-            logger.warning(f"EventBus callback failed for {event.event_type}: {e}")
+            event: The GameEvent to broadcast.
 
-    async def clear_all_subscribers(self) -> None:
+        Raises:
+            RuntimeError: If subscribers exist but no event loop is running.
+        """
+        self._run_taps(event)
+
+        callbacks_to_invoke = self._dispatch[event.event_type]
+        if not callbacks_to_invoke:
+            return
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending
+        for callback in callbacks_to_invoke:
+            task = loop.create_task(callback(event))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+    def _run_taps(self, event: GameEvent) -> None:
+        """Run every tap inline, logging (not raising) tap failures."""
+        for tap in self._taps:
+            try:
+                tap(event)
+            except Exception as e:
+                logger.warning("EventBus tap failed for %s: %s", event.event_type.name, e)
+
+    def _rebuild_dispatch(self) -> None:
+        """Recompute the merged per-type callback tuples used by emit()."""
+        wildcard = tuple(self._wildcard_subscribers.values())
+        self._dispatch = {
+            event_type: (*callbacks.values(), *wildcard)
+            for event_type, callbacks in self._subscribers.items()
+        }
+
+    def clear_all_subscribers(self) -> None:
         """
         Remove all subscribers from the event bus.
 
         This is primarily useful for testing and cleanup when shutting down
         a game session.
         """
-        async with self._lock:
-            self._subscribers.clear()
-            self._wildcard_subscribers.clear()
+        for callbacks in self._subscribers.values():
+            callbacks.clear()
+        self._wildcard_subscribers.clear()
+        self._taps = ()
+        self._total_count = 0
+        self._rebuild_dispatch()
 
     def subscriber_count(self, event_type: EventType | str | None = None) -> int:
         """
@@ -187,19 +284,65 @@ class EventBus:
             The number of subscribers.
 
         Note:
-            This method is synchronous and does not acquire the lock, so the count
-            may be stale if subscriptions are being modified concurrently. It's
-            intended for debugging and monitoring, not for synchronization.
+            It's intended for debugging and monitoring, not for synchronization.
         """
         if event_type is None:
             # Count all subscribers across all types plus wildcards
-            total = len(self._wildcard_subscribers)
-            for subscribers in self._subscribers.values():
-                total += len(subscribers)
-            return total
+            return self._total_count
         elif event_type == WILDCARD:
             return len(self._wildcard_subscribers)
         else:
-            if isinstance(event_type, str):
-                event_type = EventType[event_type.upper()]
-            return len(self._subscribers.get(event_type, []))
+            event_type = _coerce_event_type(event_type)
+            return len(self._subscribers[event_type])
+
+
+def _coerce_event_type(event_type: EventType | str) -> EventType:
+    """Convert an event type name to its EventType; EventType values pass through."""
+    if not isinstance(event_type, str):
+        return event_type
+    member = _EVENT_TYPES_BY_NAME.get(event_type)
+    if member is None:
+        # Mixed-case names; unknown names raise KeyError as before
+        member = EventType[event_type.upper()]
+    return member
+
+
+def _safe_callback(
+    callback: EventCallback, semaphore: asyncio.Semaphore | None = None
+) -> EventCallback:
+    """
+    Wrap a callback so its exceptions are logged instead of propagated.
+
+    This ensures that exceptions in one callback don't affect others. The
+    wrapper is made once per subscription, so emit() calls it directly with
+    no extra coroutine per delivery. asyncio.CancelledError is a BaseException
+    and deliberately not caught, so cancelling the emitting task, or a
+    callback task started by emit_nowait(), still cancels it.
+
+    Args:
+        callback: The subscriber to wrap.
+        semaphore: Optional limit on concurrently running callbacks, held
+                   for the duration of each call.
+
+    Returns:
+        An async function with the same signature that never raises Exception.
+    """
+    async def invoke(event: GameEvent) -> None:
+        try:
+            await callback(event)
+        except Exception as e:
+            logger.warning("EventBus callback failed for %s: %s", event.event_type.name, e)
+
+    if semaphore is None:
+        return invoke
+
+    async def invoke_limited(event: GameEvent) -> None:
+        async with semaphore:
+            await invoke(event)
+
+    return invoke_limited
+
+
+def _without(items: tuple, item) -> tuple:
+    """Return a copy of ``items`` with ``item`` removed."""
+    return tuple(x for x in items if x != item)
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -37,6 +38,11 @@ from monopoly.engine.board import PROPERTIES, RAILROADS, UTILITIES
 
 logger = logging.getLogger(__name__)
 
+# Static data for every purchasable position, merged for single lookups
+_OWNABLE_DATA: dict[int, PropertyData | RailroadData | UtilityData] = {
+    **PROPERTIES, **RAILROADS, **UTILITIES,
+}
+
 
 @dataclass
 class GameStats:
@@ -76,7 +82,8 @@ class GameRunner:
         Args:
             agents: List of 4 AI agents (must implement AgentInterface)
             seed: Random seed for deterministic gameplay (optional)
-            speed: Speed multiplier for turn delays (1.0 = normal, 0.5 = slower)
+            speed: Speed multiplier for turn delays (1.0 = normal, 0.5 = slower).
+                float("inf") or a value <= 0 runs turns back to back with no delay.
             event_bus: EventBus instance for broadcasting events (optional)
         """
         if len(agents) != 4:
@@ -94,6 +101,9 @@ class GameRunner:
         # Game control
         self._paused = False
         self._running = False
+        # Set whenever the game isn't paused; the loop waits on it while paused
+        self._unpaused = asyncio.Event()
+        self._unpaused.set()
 
         # Statistics
         self.stats = GameStats()
@@ -133,7 +143,7 @@ class GameRunner:
                 }
                 for p in self.game.players
             ],
-            "property_ownership": dict(self.game._property_owners),
+            "property_ownership": self.game.get_property_ownership(),
             "bank_houses": self.game.bank.houses_available,
             "bank_hotels": self.game.bank.hotels_available,
             "last_roll": (
@@ -171,18 +181,21 @@ class GameRunner:
     def pause(self) -> None:
         """Pause the game loop."""
         self._paused = True
+        self._unpaused.clear()
         logger.info("Game paused")
         self._emit_event(EventType.GAME_OVER, data={"reason": "paused"})
 
     def resume(self) -> None:
         """Resume the game loop."""
         self._paused = False
+        self._unpaused.set()
         logger.info("Game resumed")
 
     def stop(self) -> None:
         """Stop the game loop permanently. The current turn will finish, then the loop exits."""
         self._running = False
         self._paused = False
+        self._unpaused.set()
         logger.info("Game stopped")
 
     def set_speed(self, multiplier: float) -> None:
@@ -214,15 +227,22 @@ class GameRunner:
 
         try:
             while not self.game.is_over() and self.game.turn_number < max_turns:
+                if not self._running:
+                    break
+
                 if self._paused:
-                    await asyncio.sleep(0.1)
+                    # Woken by resume() or stop(), then re-checks the loop state
+                    await self._unpaused.wait()
                     continue
 
                 await self._run_turn()
 
-                # Turn delay based on speed
-                delay = 0.5 / self.speed
-                await asyncio.sleep(delay)
+                # Turn delay based on speed. Unthrottled games still yield once
+                # per turn so they don't starve other tasks on the loop.
+                if 0 < self.speed < math.inf:
+                    await asyncio.sleep(0.5 / self.speed)
+                else:
+                    await asyncio.sleep(0)
 
             # Game completed
             winner = self.game.get_winner()
@@ -253,7 +273,11 @@ class GameRunner:
                 data={
                     "turns": self.game.turn_number,
                     "winner": winner_info,
-                    "reason": "completed" if self.game.is_over() else "max_turns_reached",
+                    "reason": (
+                        "completed"
+                        if self.game.is_over()
+                        else ("max_turns_reached" if self._running else "stopped")
+                    ),
                 },
             )
 
@@ -335,10 +359,16 @@ class GameRunner:
     AGENT_TIMEOUT = 30.0  # seconds
 
     async def _call_agent_with_timeout(self, coro, player_id: int):
-        """Call an agent coroutine with timeout protection."""
+        """Call an agent coroutine with timeout protection.
+
+        The coroutine is awaited inline under asyncio.timeout(), which only
+        arms a timer handle. Unlike wait_for, no inner task is created per
+        decision, and a cancel() aimed at the game task always propagates.
+        """
         try:
-            return await asyncio.wait_for(coro, timeout=self.AGENT_TIMEOUT)
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(self.AGENT_TIMEOUT):
+                return await coro
+        except TimeoutError:
             logger.warning(f"Agent {player_id} timed out after {self.AGENT_TIMEOUT}s")
             raise
 
@@ -433,7 +463,7 @@ class GameRunner:
                 self._emit_event(
                     EventType.PROPERTY_UNMORTGAGED,
                     player_id=player.player_id,
-                    data={"position": position, "cost": int(self._get_property_mortgage_value(position) * 1.1)},
+                    data={"position": position, "cost": self.game.rules.unmortgage_cost(position)},
                 )
 
     async def _handle_landing(self, player) -> None:
@@ -441,7 +471,7 @@ class GameRunner:
         landing_result = self.game.process_landing(player)
 
         # Emit landing event
-        space = self.game.board.get_space(player.position)
+        space = self.game.board.get_space_unchecked(player.position)
         self._emit_event(
             EventType.PLAYER_MOVED,
             player_id=player.player_id,
@@ -623,35 +653,34 @@ class GameRunner:
         player = self.game.players[player_id]
 
         # Build opponent views
-        opponents = []
-        for p in self.game.players:
-            if p.player_id != player_id:
-                opponents.append(
-                    OpponentView(
-                        player_id=p.player_id,
-                        name=p.name,
-                        cash=p.cash,
-                        position=p.position,
-                        property_count=len(p.properties),
-                        properties=list(p.properties),
-                        is_bankrupt=p.is_bankrupt,
-                        in_jail=p.in_jail,
-                        jail_cards=p.get_out_of_jail_cards,
-                        net_worth=p.net_worth(self.game.board),
-                    )
-                )
+        board = self.game.board
+        opponents = [
+            OpponentView(
+                player_id=p.player_id,
+                name=p.name,
+                cash=p.cash,
+                position=p.position,
+                property_count=len(p.properties),
+                properties=list(p.properties),
+                is_bankrupt=p.is_bankrupt,
+                in_jail=p.in_jail,
+                jail_cards=p.get_out_of_jail_cards,
+                net_worth=p.net_worth(board),
+            )
+            for p in self.game.players
+            if p.player_id != player_id
+        ]
 
         # Build property ownership map
-        property_ownership = {pos: owner_id for pos, owner_id in self.game._property_owners.items()}
+        property_ownership = self.game.get_property_ownership()
 
-        # Build houses on board map
+        # Build houses on board map (each player's map only holds built positions)
         houses_on_board = {}
         for p in self.game.players:
-            for pos, count in p.houses.items():
-                houses_on_board[pos] = count
+            houses_on_board.update(p.houses)
 
         # Get recent events (last 20)
-        recent_events = self.game.events[-20:] if len(self.game.events) > 20 else self.game.events
+        recent_events = self.game.events[-20:]
 
         return GameView(
             my_player_id=player_id,
@@ -677,14 +706,10 @@ class GameRunner:
 
     def _get_property_data(self, position: int) -> PropertyData | RailroadData | UtilityData:
         """Get property data for a position."""
-        if position in PROPERTIES:
-            return PROPERTIES[position]
-        elif position in RAILROADS:
-            return RAILROADS[position]
-        elif position in UTILITIES:
-            return UTILITIES[position]
-        else:
-            raise ValueError(f"Position {position} is not a purchasable property")
+        try:
+            return _OWNABLE_DATA[position]
+        except KeyError:
+            raise ValueError(f"Position {position} is not a purchasable property") from None
 
     def _get_property_mortgage_value(self, position: int) -> int:
         """Get mortgage value for a property."""
@@ -694,16 +719,23 @@ class GameRunner:
     def _emit_event(self, event_type: EventType, player_id: int = -1, data: dict | None = None) -> None:
         """Emit an event to the event bus if available."""
         if self.event_bus is not None:
+            # Callers pass a fresh dict, so player_id is added in place and
+            # history can store the data without copying it.
+            if data is None:
+                data = {}
+            data["player_id"] = player_id
             event = GameEvent(
-                event_type=event_type, player_id=player_id, data=data or {}, turn_number=self.game.turn_number
+                event_type=event_type, player_id=player_id, data=data, turn_number=self.game.turn_number
             )
             try:
-                # EventBus emit is async, so we schedule it as a task
-                if hasattr(self.event_bus, "emit"):
+                # Subscribers run as their own tasks; the runner never waits on them
+                if hasattr(self.event_bus, "emit_nowait"):
+                    self.event_bus.emit_nowait(event)
+                elif hasattr(self.event_bus, "emit"):
                     import asyncio
                     asyncio.create_task(self.event_bus.emit(event))
                 elif hasattr(self.event_bus, "publish"):
                     import asyncio
                     asyncio.create_task(self.event_bus.publish(event))
             except Exception as e:
-                logger.warning(f"Failed to emit event {event_type}: {e}")
+                logger.warning(f"Failed to emit event {event_type.name}: {e}")
@@ -39,6 +39,10 @@ class TestBoardSize:
     def test_board_size_matches_constant(self, board):
         assert board.size == BOARD_SIZE
 
+    def test_boards_share_immutable_spaces(self, board):
+        assert Board().spaces is board.spaces
+        assert isinstance(board.spaces, tuple)
+
 
 # ===========================================================================
 # 2. Corner spaces
@@ -385,6 +389,11 @@ class TestColorGroupSizes:
                 assert space.property_data is not None
                 assert space.property_data.color_group == color_group
 
+    def test_property_group_positions_match_color_group(self, board):
+        for pos, prop in PROPERTIES.items():
+            assert prop.group_positions == tuple(COLOR_GROUP_POSITIONS[prop.color_group])
+            assert board.get_space(pos).property_data is prop
+
 
 # ===========================================================================
 # 10. get_space
@@ -406,6 +415,10 @@ class TestGetSpace:
         assert board.get_space(80).position == 0
         assert board.get_space(83).position == 3
 
+    def test_get_space_unchecked_matches_get_space(self, board):
+        for pos in range(40):
+            assert board.get_space_unchecked(pos) is board.get_space(pos)
+
     def test_get_space_property_has_property_data(self, board):
         space = board.get_space(1)
         assert space.property_data is not None
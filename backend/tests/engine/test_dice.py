@@ -1,5 +1,7 @@
 """Comprehensive tests for the Monopoly dice module."""
 
+import random
+
 import pytest
 
 from monopoly.engine.dice import Dice
@@ -306,3 +308,36 @@ class TestDiceRollDataclass:
         roll_a = DiceRoll(die1=2, die2=5)
         roll_b = DiceRoll(die1=2, die2=5)
         assert hash(roll_a) == hash(roll_b)
+
+
+
+class TestDiceRandintCompatibility:
+    """Rolls match the randint(1, 6) sequence for the same seed."""
+
+    def test_roll_sequence_matches_randint(self):
+        rng = random.Random(99)
+        dice = Dice(seed=99)
+        for _ in range(200):
+            roll = dice.roll()
+            assert (roll.die1, roll.die2) == (rng.randint(1, 6), rng.randint(1, 6))
+
+
+class TestBulkRoll:
+    """Dice.bulk_roll returns many rolls at once as a numpy array."""
+
+    def test_bulk_roll_shape_and_range(self):
+        np = pytest.importorskip("numpy")
+        rolls = Dice(seed=42).bulk_roll(10_000)
+        assert rolls.shape == (10_000, 2)
+        assert rolls.dtype == np.int8
+        assert rolls.min() == 1 and rolls.max() == 6
+
+    def test_bulk_roll_deterministic_with_seed(self):
+        np = pytest.importorskip("numpy")
+        assert np.array_equal(Dice(seed=7).bulk_roll(100), Dice(seed=7).bulk_roll(100))
+
+    def test_bulk_roll_does_not_affect_roll_sequence(self):
+        pytest.importorskip("numpy")
+        dice1, dice2 = Dice(seed=5), Dice(seed=5)
+        dice1.bulk_roll(50)
+        assert [dice1.roll() for _ in range(20)] == [dice2.roll() for _ in range(20)]
@@ -21,11 +21,16 @@ from monopoly.engine.board import (
 from monopoly.engine.game import Game, GO_SALARY, JAIL_FINE, MAX_JAIL_TURNS
 from monopoly.engine.player import Player, STARTING_CASH
 from monopoly.engine.types import (
+    Card,
+    CardEffect,
+    CardEffectType,
+    CardType,
     DiceRoll,
     EventType,
     GamePhase,
     JailAction,
     SpaceType,
+    TargetType,
     TradeProposal,
     TurnPhase,
     ColorGroup,
@@ -137,6 +142,15 @@ class TestPropertyOwnership:
         game = _make_game()
         game.unown_property(99)  # should not raise
 
+    def test_get_property_ownership_lists_owned_positions(self):
+        game = _make_game()
+        p0, p1 = game.players[0], game.players[1]
+        game.assign_property(p1, 5)
+        game.assign_property(p0, 1)
+        game.assign_property(p0, 3)
+        game.unown_property(3)
+        assert game.get_property_ownership() == {1: 0, 5: 1}
+
     def test_get_property_owner_returns_none_for_unowned(self):
         game = _make_game()
         assert game.get_property_owner(1) is None
@@ -617,6 +631,13 @@ class TestAuction:
         assert winner == 1
         assert game.players[1].cash == STARTING_CASH - 100
 
+    def test_tied_bids_go_to_first_bidder(self):
+        game = _make_game()
+        bids = {2: 100, 1: 100, 0: 50}
+        winner = game.auction_property(1, bids)
+        assert winner == 2
+        assert game.players[2].cash == STARTING_CASH - 100
+
     def test_bankrupt_player_bid_filtered(self):
         game = _make_game()
         game.players[0].is_bankrupt = True
@@ -1498,6 +1519,28 @@ class TestEventRetrieval:
         game.roll_dice()
         assert game.get_events_since(len(game.events)) == []
 
+    def test_silent_suppresses_events_but_not_state(self):
+        game = _make_game()
+        player = game.players[0]
+        with game.silent():
+            game.roll_dice()
+            game.move_player(player, 38)
+            game.move_player(player, 4)
+        assert game.events == []
+        assert player.position == 2
+        assert player.cash == STARTING_CASH + GO_SALARY
+
+        game.roll_dice()
+        assert len(_events_of_type(game, EventType.DICE_ROLLED)) == 1
+
+    def test_silent_restores_on_error(self):
+        game = _make_game()
+        with pytest.raises(RuntimeError):
+            with game.silent():
+                raise RuntimeError("boom")
+        game.roll_dice()
+        assert len(game.events) == 1
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # 21. Sell hotel
@@ -1728,3 +1771,74 @@ class TestEdgeCases:
         player.position = 5
         result = game.process_landing(player)
         assert result.rent_owed == 200  # 4 railroads
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# 26. Card effects
+# ────────────────────────────────────────────────────────────────────────────
+
+def _card(effect_type: CardEffectType, **kwargs) -> Card:
+    """Build a Chance card with the given effect."""
+    return Card(deck=CardType.CHANCE, effect=CardEffect(description="test", effect_type=effect_type, **kwargs))
+
+
+class TestCardEffects:
+    """Tests for applying Chance / Community Chest card effects."""
+
+    def test_repairs_charges_per_house_and_per_hotel(self):
+        game = _make_game()
+        player = game.players[0]
+        for pos in (1, 3, 6):
+            game.assign_property(player, pos)
+        player.set_houses(1, 2)
+        player.set_houses(3, 5)  # hotel
+
+        card = _card(CardEffectType.REPAIRS, per_house=25, per_hotel=100)
+        game._apply_card_effect(player, card, game.chance_deck)
+        assert player.cash == STARTING_CASH - (2 * 25 + 100)
+
+    def test_repairs_without_buildings_is_free(self):
+        game = _make_game()
+        player = game.players[0]
+        game.assign_property(player, 1)
+
+        card = _card(CardEffectType.REPAIRS, per_house=25, per_hotel=100)
+        game._apply_card_effect(player, card, game.chance_deck)
+        assert player.cash == STARTING_CASH
+
+    def test_go_back_moves_backwards(self):
+        game = _make_game()
+        player = game.players[0]
+        player.position = 7
+
+        game._apply_card_effect(player, _card(CardEffectType.GO_BACK, value=3), game.chance_deck)
+        assert player.position == 4
+
+    def test_go_back_wraps_past_go(self):
+        game = _make_game()
+        player = game.players[0]
+        player.position = 2
+
+        game._apply_card_effect(player, _card(CardEffectType.GO_BACK, value=3), game.chance_deck)
+        assert player.position == 39
+        assert player.cash == STARTING_CASH  # moving backwards never collects GO
+
+    def test_advance_to_nearest_railroad_wraps_past_go(self):
+        game = _make_game()
+        player = game.players[0]
+        player.position = 36
+
+        card = _card(CardEffectType.ADVANCE_TO_NEAREST, target_type=TargetType.RAILROAD)
+        game._apply_card_effect(player, card, game.chance_deck)
+        assert player.position == 5
+        assert player.cash == STARTING_CASH + GO_SALARY
+
+    def test_advance_to_nearest_utility(self):
+        game = _make_game()
+        player = game.players[0]
+        player.position = 22
+
+        card = _card(CardEffectType.ADVANCE_TO_NEAREST, target_type=TargetType.UTILITY)
+        game._apply_card_effect(player, card, game.chance_deck)
+        assert player.position == 28
+        assert player.cash == STARTING_CASH
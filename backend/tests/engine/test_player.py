@@ -176,6 +176,44 @@ class TestPropertyManagement:
         assert player.properties == [3]
         assert player.owns_property(1) is False
 
+    def test_add_properties_skips_owned(self, player):
+        player.add_property(3)
+        player.add_properties([1, 3, 5])
+        assert player.properties == [3, 1, 5]
+        assert player.owns_property(5) is True
+
+    def test_owns_all(self, player):
+        player.add_properties([1, 3, 6])
+        assert player.owns_all((1, 3)) is True
+        assert player.owns_all((1, 8)) is False
+        assert player.owns_all(()) is True
+
+    def test_count_unmortgaged(self, player):
+        player.add_properties([5, 15, 25, 12])
+        player.mortgage_property(15)
+        assert player.count_unmortgaged(frozenset({5, 15, 25, 35})) == 2
+        assert player.count_unmortgaged(frozenset()) == 0
+
+    def test_clear_properties(self, player):
+        player.add_properties([1, 3])
+        player.set_houses(1, 2)
+        player.mortgage_property(3)
+        player.clear_properties()
+        assert player.properties == []
+        assert player.owns_property(1) is False
+        assert player.houses == {}
+        assert player.mortgaged == set()
+
+    def test_remove_properties(self, player):
+        player.add_properties([1, 3, 5])
+        player.set_houses(1, 2)
+        player.mortgage_property(5)
+        player.remove_properties([5, 1, 99])
+        assert player.properties == [3]
+        assert player.owns_property(1) is False
+        assert player.houses == {}
+        assert player.mortgaged == set()
+
     def test_remove_nonexistent_property_is_noop(self, player):
         player.add_property(1)
         player.remove_property(99)  # Not owned
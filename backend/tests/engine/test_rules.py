@@ -783,6 +783,22 @@ class TestTradeValidation:
         assert valid is False
         assert "Must sell buildings" in reason
 
+    def test_trade_reports_first_invalid_offered_property(self, rules):
+        """The reason names the first offending position in offer order."""
+        proposer = _make_player(pid=0, cash=5000)
+        receiver = _make_player(pid=1, cash=5000)
+        _give_monopoly(proposer, ColorGroup.BROWN)
+        proposer.set_houses(3, 1)
+
+        trade = TradeProposal(
+            proposer_id=0,
+            receiver_id=1,
+            offered_properties=[1, 3, 6],
+        )
+        valid, reason = rules.validate_trade(trade, proposer, receiver)
+        assert valid is False
+        assert reason == "Must sell buildings before trading property at position 3"
+
     def test_trade_must_involve_something(self, rules):
         """A completely empty trade is invalid."""
         proposer = _make_player(pid=0)
@@ -150,6 +150,21 @@ class TestTradeWithJailCards:
         assert player_a.cash == 1550
         assert player_b.cash == 1450
 
+    def test_trade_jail_cards_both_ways(self, rules):
+        player_a = Player(player_id=0, name="Alice")
+        player_a.get_out_of_jail_cards = 1
+        player_b = Player(player_id=1, name="Bob")
+        player_b.get_out_of_jail_cards = 2
+
+        proposal = TradeProposal(
+            proposer_id=0, receiver_id=1,
+            offered_jail_cards=1, requested_jail_cards=2,
+        )
+        execute_trade(proposal, player_a, player_b, rules)
+
+        assert player_a.get_out_of_jail_cards == 2
+        assert player_b.get_out_of_jail_cards == 1
+
 
 class TestMortgagedPropertyTrade:
     """Tests for trading mortgaged properties."""
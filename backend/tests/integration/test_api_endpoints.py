@@ -6,12 +6,18 @@ to avoid needing real LLM API keys.
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 
 from monopoly.agents.random_agent import RandomAgent
+from monopoly.api import routes
 from monopoly.api.main import app
-from monopoly.api.storage import game_storage
+from monopoly.api.models import StartGameResponse
+from monopoly.api.storage import EventHistory, game_storage
+from monopoly.engine.player import STARTING_CASH
+from monopoly.engine.types import EventType, GameEvent
 from monopoly.orchestrator.event_bus import EventBus
 from monopoly.orchestrator.game_runner import GameRunner
 
@@ -83,6 +89,30 @@ def test_list_games_with_game(client, game_id):
     assert game_id in data["games"]
 
 
+# ── Start Game ──
+
+
+def test_start_game_response(client, monkeypatch):
+    """Starting a game returns 201 with a body matching StartGameResponse."""
+    monkeypatch.setattr(
+        routes, "create_agent_from_config", lambda player_id, config, event_bus: RandomAgent(player_id)
+    )
+
+    response = client.post("/api/game/start", json={"seed": 7, "speed": 5.0})
+    assert response.status_code == 201
+    data = response.json()
+    try:
+        assert set(data) == {"game_id", "players", "status", "seed", "created_at"}
+        StartGameResponse.model_validate(data)
+        assert data["status"] == "in_progress"
+        assert data["seed"] == 7
+        assert [p["id"] for p in data["players"]] == [0, 1, 2, 3]
+        assert all(p["cash"] == STARTING_CASH for p in data["players"])
+        assert all(p["position"] == 0 for p in data["players"])
+    finally:
+        game_storage.remove_game(data["game_id"])
+
+
 # ── Game State ──
 
 
@@ -103,6 +133,83 @@ def test_get_state_missing_game(client):
     assert response.status_code == 404
 
 
+# ── Game History ──
+
+
+def test_get_history_streams_events(client, game_id):
+    """History endpoint returns all recorded events in order."""
+    history = game_storage.get_event_history(game_id)
+    for turn in range(3):
+        history.add_event(GameEvent(event_type=EventType.DICE_ROLLED, player_id=0), turn)
+
+    response = client.get(f"/api/game/{game_id}/history")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["game_id"] == game_id
+    assert [e["sequence"] for e in data["events"]] == [0, 1, 2]
+    assert data["events"][0]["event"] == "DICE_ROLLED"
+    assert data["events"][0]["data"] == {"player_id": 0}
+    assert data["total_events"] == 3
+    assert data["has_more"] is False
+
+
+def test_get_history_since_and_limit(client, game_id):
+    """History endpoint honours since/limit and reports has_more."""
+    history = game_storage.get_event_history(game_id)
+    for turn in range(5):
+        history.add_event(GameEvent(event_type=EventType.TURN_STARTED), turn)
+
+    response = client.get(f"/api/game/{game_id}/history", params={"since": 1, "limit": 2})
+    data = response.json()
+    assert [e["sequence"] for e in data["events"]] == [1, 2]
+    assert data["has_more"] is True
+
+
+def test_get_history_spans_multiple_batches(client, game_id, monkeypatch):
+    """Events encoded across several stream batches are joined into one valid array."""
+    monkeypatch.setattr(routes, "HISTORY_BATCH_SIZE", 2)
+    history = game_storage.get_event_history(game_id)
+    for turn in range(5):
+        history.add_event(GameEvent(event_type=EventType.TURN_STARTED), turn)
+
+    response = client.get(f"/api/game/{game_id}/history")
+    assert response.status_code == 200
+    data = response.json()
+    assert [e["sequence"] for e in data["events"]] == [0, 1, 2, 3, 4]
+    assert data["total_events"] == 5
+    assert data["has_more"] is False
+
+
+def test_get_history_empty(client, game_id):
+    """A game with no recorded events streams an empty event list."""
+    response = client.get(f"/api/game/{game_id}/history")
+    assert response.status_code == 200
+    assert response.json()["events"] == []
+
+
+def test_history_shares_event_data_with_player_id():
+    """Event data that already carries player_id is stored without copying."""
+    history = EventHistory()
+    event = GameEvent(event_type=EventType.DICE_ROLLED, player_id=2, data={"total": 7, "player_id": 2})
+    enriched = history.add_event(event, 1)
+    assert enriched.data is event.data
+
+
+def test_history_injects_default_player_id():
+    """Events without player_id in data get a copy carrying the GameEvent default of -1."""
+    history = EventHistory()
+    event = GameEvent(event_type=EventType.GAME_STARTED, data={"seed": 1})
+    enriched = history.add_event(event, 0)
+    assert enriched.data == {"seed": 1, "player_id": -1}
+    assert event.data == {"seed": 1}
+
+
+def test_get_history_missing_game(client):
+    """Getting history of a non-existent game returns 404."""
+    response = client.get("/api/game/nonexistent/history")
+    assert response.status_code == 404
+
+
 # ── Game Agents ──
 
 
@@ -147,3 +254,45 @@ def test_set_speed_missing_game(client):
     """Setting speed on non-existent game returns 404."""
     response = client.post("/api/game/nonexistent/speed", json={"speed": 1.0})
     assert response.status_code == 404
+
+
+# ── Storage Lifecycle ──
+
+
+@pytest.mark.asyncio
+async def test_remove_game_stops_background_loop():
+    """Removing a game stops its background loop before max_turns is reached."""
+    agents = [RandomAgent(i) for i in range(4)]
+    event_bus = EventBus()
+    runner = GameRunner(agents=agents, seed=42, speed=10.0, event_bus=event_bus)
+
+    gid = "test-game-task"
+    game_storage.add_game(gid, runner, event_bus)
+    task = game_storage.start_task(gid, runner.run_game(max_turns=200))
+    await asyncio.sleep(0.05)
+
+    game_storage.remove_game(gid)
+    done, _ = await asyncio.wait({task}, timeout=5.0)
+
+    assert task in done
+    assert runner.game.turn_number < 200
+    assert game_storage.get_game(gid) is None
+    assert not event_bus._taps
+
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_all_background_loops():
+    """Storage shutdown stops every running game loop and clears storage."""
+    runners = []
+    for n in range(2):
+        event_bus = EventBus()
+        runner = GameRunner(agents=[RandomAgent(i) for i in range(4)], seed=n, speed=10.0, event_bus=event_bus)
+        game_storage.add_game(f"test-shutdown-{n}", runner, event_bus)
+        game_storage.start_task(f"test-shutdown-{n}", runner.run_game(max_turns=200))
+        runners.append(runner)
+    await asyncio.sleep(0.05)
+
+    await asyncio.wait_for(game_storage.shutdown(), timeout=10.0)
+
+    assert game_storage.list_games() == []
+    assert all(not r._running and r.game.turn_number < 200 for r in runners)
@@ -83,7 +83,7 @@ async def test_events_emitted_to_bus(random_agents, event_bus):
     async def listener(event: GameEvent) -> None:
         received_events.append(event)
 
-    await event_bus.subscribe("*", listener)
+    event_bus.subscribe("*", listener)
 
     runner = GameRunner(agents=random_agents, seed=42, speed=100.0, event_bus=event_bus)
     await runner.run_game(max_turns=10)
@@ -98,6 +98,20 @@ async def test_events_emitted_to_bus(random_agents, event_bus):
     assert EventType.DICE_ROLLED in event_types
 
 
+@pytest.mark.asyncio
+async def test_emitted_event_data_carries_player_id(random_agents, event_bus):
+    """Runner events carry player_id in data so history can share the dict."""
+    received_events = []
+    event_bus.add_tap(received_events.append)
+
+    runner = GameRunner(agents=random_agents, seed=42, speed=100.0, event_bus=event_bus)
+    await runner.run_game(max_turns=10)
+    await asyncio.sleep(0.1)
+
+    assert received_events
+    assert all(e.data["player_id"] == e.player_id for e in received_events)
+
+
 # ── Game State Queries ──
 
 
@@ -167,6 +181,88 @@ def test_resume_clears_flag(game_runner):
     assert game_runner._paused is False
 
 
+@pytest.mark.asyncio
+async def test_paused_loop_waits_until_resumed(random_agents):
+    """A paused game plays no turns until resume() wakes the loop."""
+    runner = GameRunner(agents=random_agents, seed=42, speed=float("inf"))
+    runner.pause()
+    task = asyncio.create_task(runner.run_game(max_turns=5))
+
+    await asyncio.sleep(0.05)
+    assert runner.game.turn_number == 0
+    assert not task.done()
+
+    runner.resume()
+    result = await asyncio.wait_for(task, timeout=5)
+    assert result["turns"] > 0
+
+
+@pytest.mark.asyncio
+async def test_stop_wakes_paused_loop(random_agents):
+    """stop() ends a paused game without waiting for a resume."""
+    runner = GameRunner(agents=random_agents, seed=42, speed=float("inf"))
+    runner.pause()
+    task = asyncio.create_task(runner.run_game(max_turns=5))
+    await asyncio.sleep(0)
+
+    runner.stop()
+    await asyncio.wait_for(task, timeout=5)
+    assert runner.game.turn_number == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_game_at_any_point(random_agents):
+    """Cancelling the game task stops it wherever the loop happens to be."""
+    for yields in range(1, 25):
+        runner = GameRunner(agents=[RandomAgent(i) for i in range(4)], seed=42, speed=float("inf"))
+        task = asyncio.create_task(runner.run_game(max_turns=500))
+        for _ in range(yields):
+            await asyncio.sleep(0)
+
+        task.cancel()
+        await asyncio.wait({task}, timeout=5)
+        assert task.cancelled(), f"cancel after {yields} yields was swallowed"
+
+
+@pytest.mark.asyncio
+async def test_slow_agent_call_times_out(random_agents, monkeypatch):
+    """A decision that exceeds AGENT_TIMEOUT raises TimeoutError for the caller's fallback."""
+    runner = GameRunner(agents=random_agents, seed=42, speed=float("inf"))
+    monkeypatch.setattr(runner, "AGENT_TIMEOUT", 0.01)
+
+    async def never():
+        await asyncio.Event().wait()
+
+    with pytest.raises(TimeoutError):
+        await runner._call_agent_with_timeout(never(), 0)
+
+
+def test_get_property_data_covers_all_ownables(game_runner):
+    """Properties, railroads and utilities resolve; other spaces raise ValueError."""
+    assert game_runner._get_property_data(1).name == "Mediterranean Avenue"
+    assert game_runner._get_property_data(5).name == "Reading Railroad"
+    assert game_runner._get_property_data(12).name == "Electric Company"
+    with pytest.raises(ValueError):
+        game_runner._get_property_data(0)
+
+
+def test_game_view_merges_houses_and_isolates_player_state(game_runner):
+    """houses_on_board covers every player; the agent's own collections are copies."""
+    players = game_runner.game.players
+    players[0].add_properties([1, 3])
+    players[0].houses[1] = 2
+    players[2].houses[39] = 5
+
+    view = game_runner._build_game_view(0)
+    assert view.houses_on_board == {1: 2, 39: 5}
+    assert [opp.player_id for opp in view.opponents] == [1, 2, 3]
+
+    view.my_houses[3] = 4
+    view.my_properties.append(5)
+    assert players[0].houses == {1: 2}
+    assert players[0].properties == [1, 3]
+
+
 # ── Agent count validation ──
 
 
@@ -6,15 +6,19 @@ RandomAgent game runners to avoid needing real LLM API keys.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 
 import pytest
 from fastapi.testclient import TestClient
+from fastapi.websockets import WebSocketState
 
 from monopoly.agents.random_agent import RandomAgent
 from monopoly.api.main import app
 from monopoly.api.storage import game_storage
+from monopoly.api.websocket import CLIENT_QUEUE_SIZE, ConnectionManager
+from monopoly.engine.types import EventType, GameEvent
 from monopoly.orchestrator.event_bus import EventBus
 from monopoly.orchestrator.game_runner import GameRunner
 
@@ -47,7 +51,7 @@ def game_id():
 def test_websocket_connect_valid_game(client, game_id):
     """Connecting to a valid game should receive game_state_sync."""
     with client.websocket_connect(f"/ws/game/{game_id}") as ws:
-        data = ws.receive_json()
+        data = ws.receive_json(mode="binary")
         assert data["event"] == "game_state_sync"
         assert data["data"]["game_id"] == game_id
         assert len(data["data"]["players"]) == 4
@@ -58,13 +62,13 @@ def test_websocket_connect_invalid_game(client):
     """Connecting to a non-existent game should fail."""
     with pytest.raises(Exception):
         with client.websocket_connect("/ws/game/nonexistent") as ws:
-            ws.receive_json()
+            ws.receive_json(mode="binary")
 
 
 def test_websocket_sync_has_board(client, game_id):
     """The game_state_sync message should include board data."""
     with client.websocket_connect(f"/ws/game/{game_id}") as ws:
-        data = ws.receive_json()
+        data = ws.receive_json(mode="binary")
         assert "board" in data["data"]
         assert len(data["data"]["board"]) == 40
         # First space should be GO
@@ -74,7 +78,7 @@ def test_websocket_sync_has_board(client, game_id):
 def test_websocket_sync_has_bank(client, game_id):
     """The game_state_sync should include bank state."""
     with client.websocket_connect(f"/ws/game/{game_id}") as ws:
-        data = ws.receive_json()
+        data = ws.receive_json(mode="binary")
         bank = data["data"]["bank"]
         assert bank["houses_available"] == 32
         assert bank["hotels_available"] == 12
@@ -84,7 +88,7 @@ def test_websocket_speed_control(client, game_id):
     """Client can send speed control messages."""
     with client.websocket_connect(f"/ws/game/{game_id}") as ws:
         # Receive initial sync
-        ws.receive_json()
+        ws.receive_json(mode="binary")
 
         # Send speed change
         ws.send_json({"action": "set_speed", "data": {"speed": 3.0}})
@@ -95,3 +99,162 @@ def test_websocket_speed_control(client, game_id):
         # Verify speed was changed
         runner = game_storage.get_game(game_id)
         assert runner.speed == 3.0
+
+
+def test_websocket_control_messages_accept_binary_and_bad_json(client, game_id):
+    """Control messages work as binary frames, and malformed JSON is ignored."""
+    with client.websocket_connect(f"/ws/game/{game_id}") as ws:
+        ws.receive_json(mode="binary")
+
+        ws.send_text("{not json")
+        ws.send_bytes(b'{"action": "set_speed", "data": {"speed": 2.5}}')
+        time.sleep(0.1)
+
+        assert game_storage.get_game(game_id).speed == 2.5
+
+
+def test_websocket_forwards_events_recorded_once(client, game_id):
+    """Events reach every connected client but are recorded in history only once."""
+    event_bus = game_storage.get_event_bus(game_id)
+    history = game_storage.get_event_history(game_id)
+    event = GameEvent(event_type=EventType.DICE_ROLLED, player_id=1, data={"total": 7, "player_id": 1})
+
+    with client.websocket_connect(f"/ws/game/{game_id}") as ws1:
+        ws1.receive_json(mode="binary")
+        with client.websocket_connect(f"/ws/game/{game_id}") as ws2:
+            ws2.receive_json(mode="binary")
+            ws1.portal.call(event_bus.emit, event)
+
+            messages = [ws1.receive_json(mode="binary"), ws2.receive_json(mode="binary")]
+            assert history.get_event_count() == 1
+            assert len(history._listeners) == 1  # one forwarder for the game
+
+    assert history._listeners == []
+
+    assert all(m["event"] == "DICE_ROLLED" and m["sequence"] == 0 for m in messages)
+
+
+def test_websocket_sync_cached_until_state_changes(client, game_id):
+    """Viewers joining an unchanged game get the cached sync; a new event invalidates it."""
+    session = game_storage.get_session(game_id)
+
+    with client.websocket_connect(f"/ws/game/{game_id}") as ws1:
+        first = ws1.receive_bytes()
+        cached = session.sync_cache
+        with client.websocket_connect(f"/ws/game/{game_id}") as ws2:
+            assert ws2.receive_bytes() == first
+            assert session.sync_cache is cached
+
+            session.history.add_event(GameEvent(event_type=EventType.TURN_STARTED), 0)
+            ws1.receive_bytes()
+            ws2.receive_bytes()
+            with client.websocket_connect(f"/ws/game/{game_id}") as ws3:
+                ws3.receive_bytes()
+                assert session.sync_cache is not cached
+
+
+# ── ConnectionManager ──
+
+
+class _FakeWebSocket:
+    """Minimal stand-in for a connected WebSocket."""
+
+    def __init__(self, fail: bool = False, stalled: bool = False) -> None:
+        self.client_state = WebSocketState.CONNECTED
+        self.fail = fail
+        self.stalled = stalled
+        self.sent: list[bytes] = []
+        self.close_code: int | None = None
+
+    async def send_bytes(self, payload: bytes) -> None:
+        if self.fail:
+            raise RuntimeError("connection lost")
+        if self.stalled:
+            await asyncio.Event().wait()
+        self.sent.append(payload)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+@pytest.mark.asyncio
+async def test_send_event_fans_out_and_drops_failed_connections():
+    """send_event delivers one encoded payload to every client and drops failing ones."""
+    manager = ConnectionManager()
+    ok, broken = _FakeWebSocket(), _FakeWebSocket(fail=True)
+    manager._add_client(ok, "g")
+    manager._add_client(broken, "g")
+
+    await manager.send_event("g", {"event": "DICE_ROLLED", "data": {"total": 7}})
+    await asyncio.sleep(0)
+    await manager.send_event("g", {"event": "TURN_STARTED", "data": {}})
+    await asyncio.sleep(0)
+
+    assert [json.loads(p)["event"] for p in ok.sent] == ["DICE_ROLLED", "TURN_STARTED"]
+    assert manager.active_connections["g"] == {ok}
+    manager.disconnect(ok, "g")
+
+
+@pytest.mark.asyncio
+async def test_send_event_without_clients_skips_encoding():
+    """With no connected clients the event is never encoded."""
+    manager = ConnectionManager()
+    manager.active_connections["g"] = set()
+
+    # An unencodable event would raise if send_event tried to serialize it
+    await manager.send_event("g", {"event": object()})
+    await manager.send_event("missing", {"event": object()})
+
+
+@pytest.mark.asyncio
+async def test_send_event_drops_client_whose_queue_is_full():
+    """A client that can't keep up is dropped and closed instead of buffering without bound."""
+    manager = ConnectionManager()
+    ok, slow = _FakeWebSocket(), _FakeWebSocket(stalled=True)
+    manager._add_client(ok, "g")
+    manager._add_client(slow, "g")
+
+    for turn in range(CLIENT_QUEUE_SIZE + 2):
+        await manager.send_event("g", {"event": "TURN_STARTED", "turn_number": turn})
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert manager.active_connections["g"] == {ok}
+    assert slow.close_code == 1013
+    assert len(ok.sent) == CLIENT_QUEUE_SIZE + 2
+    manager.disconnect(ok, "g")
+
+
+def test_websocket_sync_encodes_player_houses(client, game_id):
+    """Player house maps keyed by int position are encoded in the sync."""
+    game = game_storage.get_game(game_id).game
+    game.players[0].houses[1] = 2
+
+    with client.websocket_connect(f"/ws/game/{game_id}") as ws:
+        players = ws.receive_json(mode="binary")["data"]["players"]
+
+    assert players[0]["houses"] == {"1": 2}
+
+
+def test_websocket_sync_board_overlays_houses_and_mortgages(client, game_id):
+    """Board entries in the sync reflect owners, houses and mortgages."""
+    game = game_storage.get_game(game_id).game
+    game.buy_property(game.players[0], 1)
+    game.buy_property(game.players[0], 3)
+    game.players[0].houses[1] = 2
+    game.buy_property(game.players[1], 5)
+    game.mortgage_property(game.players[1], 5)
+
+    with client.websocket_connect(f"/ws/game/{game_id}") as ws:
+        board = ws.receive_json(mode="binary")["data"]["board"]
+
+    assert board[1] == {
+        "position": 1,
+        "name": "Mediterranean Avenue",
+        "type": "PROPERTY",
+        "owner_id": 0,
+        "houses": 2,
+        "is_mortgaged": False,
+    }
+    assert board[5]["owner_id"] == 1 and board[5]["is_mortgaged"] is True
+    assert board[0]["owner_id"] is None and board[0]["houses"] == 0
@@ -21,7 +21,7 @@ class TestEventBusBasics:
         async def callback(event: GameEvent):
             received_events.append(event)
 
-        await bus.subscribe(EventType.DICE_ROLLED, callback)
+        bus.subscribe(EventType.DICE_ROLLED, callback)
 
         event = GameEvent(
             event_type=EventType.DICE_ROLLED,
@@ -47,8 +47,8 @@ class TestEventBusBasics:
         async def callback_2(event: GameEvent):
             received_2.append(event)
 
-        await bus.subscribe(EventType.PLAYER_MOVED, callback_1)
-        await bus.subscribe(EventType.PLAYER_MOVED, callback_2)
+        bus.subscribe(EventType.PLAYER_MOVED, callback_1)
+        bus.subscribe(EventType.PLAYER_MOVED, callback_2)
 
         event = GameEvent(
             event_type=EventType.PLAYER_MOVED,
@@ -72,7 +72,7 @@ class TestEventBusBasics:
         async def callback(event: GameEvent):
             received.append(event)
 
-        await bus.subscribe(EventType.RENT_PAID, callback)
+        bus.subscribe(EventType.RENT_PAID, callback)
 
         # Emit first event
         event1 = GameEvent(
@@ -85,7 +85,7 @@ class TestEventBusBasics:
         assert len(received) == 1
 
         # Unsubscribe
-        await bus.unsubscribe(EventType.RENT_PAID, callback)
+        bus.unsubscribe(EventType.RENT_PAID, callback)
 
         # Emit second event
         event2 = GameEvent(
@@ -112,8 +112,8 @@ class TestEventBusBasics:
         async def move_callback(event: GameEvent):
             move_events.append(event)
 
-        await bus.subscribe(EventType.DICE_ROLLED, dice_callback)
-        await bus.subscribe(EventType.PLAYER_MOVED, move_callback)
+        bus.subscribe(EventType.DICE_ROLLED, dice_callback)
+        bus.subscribe(EventType.PLAYER_MOVED, move_callback)
 
         # Emit dice event
         dice_event = GameEvent(event_type=EventType.DICE_ROLLED, player_id=0, turn_number=1)
@@ -141,7 +141,7 @@ class TestWildcardSubscriptions:
         async def wildcard_callback(event: GameEvent):
             all_events.append(event)
 
-        await bus.subscribe(WILDCARD, wildcard_callback)
+        bus.subscribe(WILDCARD, wildcard_callback)
 
         # Emit various event types
         event1 = GameEvent(event_type=EventType.DICE_ROLLED, player_id=0, turn_number=1)
@@ -170,8 +170,8 @@ class TestWildcardSubscriptions:
         async def dice_callback(event: GameEvent):
             dice_events.append(event)
 
-        await bus.subscribe(WILDCARD, wildcard_callback)
-        await bus.subscribe(EventType.DICE_ROLLED, dice_callback)
+        bus.subscribe(WILDCARD, wildcard_callback)
+        bus.subscribe(EventType.DICE_ROLLED, dice_callback)
 
         dice_event = GameEvent(event_type=EventType.DICE_ROLLED, player_id=0, turn_number=1)
         move_event = GameEvent(event_type=EventType.PLAYER_MOVED, player_id=0, turn_number=1)
@@ -185,6 +185,26 @@ class TestWildcardSubscriptions:
         assert len(dice_events) == 1
         assert dice_events[0].event_type == EventType.DICE_ROLLED
 
+    @pytest.mark.asyncio
+    async def test_wildcard_added_after_specific_subscriber(self):
+        """A wildcard subscribed later still reaches types that already have subscribers."""
+        bus = EventBus()
+        order = []
+
+        async def dice_callback(event: GameEvent):
+            order.append("dice")
+
+        async def wildcard_callback(event: GameEvent):
+            order.append("wildcard")
+
+        bus.subscribe(EventType.DICE_ROLLED, dice_callback)
+        bus.subscribe(WILDCARD, wildcard_callback)
+        await bus.emit(GameEvent(event_type=EventType.DICE_ROLLED, turn_number=1))
+        bus.unsubscribe(WILDCARD, wildcard_callback)
+        await bus.emit(GameEvent(event_type=EventType.DICE_ROLLED, turn_number=1))
+
+        assert order == ["dice", "wildcard", "dice"]
+
     @pytest.mark.asyncio
     async def test_unsubscribe_wildcard(self):
         """Test unsubscribing from wildcard events."""
@@ -194,13 +214,13 @@ class TestWildcardSubscriptions:
         async def callback(event: GameEvent):
             received.append(event)
 
-        await bus.subscribe(WILDCARD, callback)
+        bus.subscribe(WILDCARD, callback)
 
         event1 = GameEvent(event_type=EventType.TURN_STARTED, player_id=0, turn_number=1)
         await bus.emit(event1)
         assert len(received) == 1
 
-        await bus.unsubscribe(WILDCARD, callback)
+        bus.unsubscribe(WILDCARD, callback)
 
         event2 = GameEvent(event_type=EventType.TURN_STARTED, player_id=0, turn_number=2)
         await bus.emit(event2)
@@ -224,8 +244,8 @@ class TestExceptionHandling:
         async def good_callback(event: GameEvent):
             good_callback_invoked.append(event)
 
-        await bus.subscribe(EventType.GAME_STARTED, bad_callback)
-        await bus.subscribe(EventType.GAME_STARTED, good_callback)
+        bus.subscribe(EventType.GAME_STARTED, bad_callback)
+        bus.subscribe(EventType.GAME_STARTED, good_callback)
 
         event = GameEvent(event_type=EventType.GAME_STARTED, turn_number=0)
         await bus.emit(event)
@@ -234,6 +254,17 @@ class TestExceptionHandling:
         assert len(bad_callback_invoked) == 1
         assert len(good_callback_invoked) == 1
 
+    @pytest.mark.asyncio
+    async def test_single_callback_exception_is_contained(self):
+        """A lone subscriber is awaited directly but its exception is still logged, not raised."""
+        bus = EventBus()
+
+        async def bad_callback(event: GameEvent):
+            raise ValueError("Intentional test error")
+
+        bus.subscribe(EventType.GAME_STARTED, bad_callback)
+        await bus.emit(GameEvent(event_type=EventType.GAME_STARTED, turn_number=0))
+
 
 class TestConcurrency:
     """Test concurrent event emission and subscription."""
@@ -249,7 +280,7 @@ class TestConcurrency:
             await asyncio.sleep(0.01)
             received.append(event)
 
-        await bus.subscribe(EventType.AGENT_SPOKE, callback)
+        bus.subscribe(EventType.AGENT_SPOKE, callback)
 
         # Emit multiple events concurrently
         events = [
@@ -271,14 +302,14 @@ class TestConcurrency:
             received.append(event)
 
         # Subscribe to one type
-        await bus.subscribe(EventType.DICE_ROLLED, callback)
+        bus.subscribe(EventType.DICE_ROLLED, callback)
 
         # Emit an event
         event1 = GameEvent(event_type=EventType.DICE_ROLLED, player_id=0, turn_number=1)
         emission_task = asyncio.create_task(bus.emit(event1))
 
         # Subscribe to another type while emission is happening
-        await bus.subscribe(EventType.PLAYER_MOVED, callback)
+        bus.subscribe(EventType.PLAYER_MOVED, callback)
 
         await emission_task
 
@@ -302,10 +333,10 @@ class TestSubscriberCount:
 
         assert bus.subscriber_count(EventType.DICE_ROLLED) == 0
 
-        await bus.subscribe(EventType.DICE_ROLLED, callback1)
+        bus.subscribe(EventType.DICE_ROLLED, callback1)
         assert bus.subscriber_count(EventType.DICE_ROLLED) == 1
 
-        await bus.subscribe(EventType.DICE_ROLLED, callback2)
+        bus.subscribe(EventType.DICE_ROLLED, callback2)
         assert bus.subscriber_count(EventType.DICE_ROLLED) == 2
 
     @pytest.mark.asyncio
@@ -318,7 +349,7 @@ class TestSubscriberCount:
 
         assert bus.subscriber_count(WILDCARD) == 0
 
-        await bus.subscribe(WILDCARD, callback)
+        bus.subscribe(WILDCARD, callback)
         assert bus.subscriber_count(WILDCARD) == 1
 
     @pytest.mark.asyncio
@@ -329,14 +360,33 @@ class TestSubscriberCount:
         async def callback(event: GameEvent):
             pass
 
-        await bus.subscribe(EventType.DICE_ROLLED, callback)
-        await bus.subscribe(EventType.PLAYER_MOVED, callback)
-        await bus.subscribe(WILDCARD, callback)
+        bus.subscribe(EventType.DICE_ROLLED, callback)
+        bus.subscribe(EventType.PLAYER_MOVED, callback)
+        bus.subscribe(WILDCARD, callback)
 
         # Total should be 3 (one per subscription)
         assert bus.subscriber_count() == 3
 
 
+    def test_total_count_tracks_duplicates_and_missing_unsubscribes(self):
+        """The running total ignores repeat subscriptions and no-op unsubscribes."""
+        bus = EventBus()
+
+        async def callback(event: GameEvent):
+            pass
+
+        bus.subscribe(EventType.RENT_PAID, callback)
+        bus.subscribe(EventType.RENT_PAID, callback)
+        bus.subscribe(WILDCARD, callback)
+        bus.unsubscribe(EventType.DICE_ROLLED, callback)
+        assert bus.subscriber_count() == 2
+
+        bus.unsubscribe(EventType.RENT_PAID, callback)
+        assert bus.subscriber_count() == 1
+        bus.clear_all_subscribers()
+        assert bus.subscriber_count() == 0
+
+
 class TestClearSubscribers:
     """Test clearing all subscribers."""
 
@@ -349,13 +399,13 @@ class TestClearSubscribers:
         async def callback(event: GameEvent):
             received.append(event)
 
-        await bus.subscribe(EventType.DICE_ROLLED, callback)
-        await bus.subscribe(EventType.PLAYER_MOVED, callback)
-        await bus.subscribe(WILDCARD, callback)
+        bus.subscribe(EventType.DICE_ROLLED, callback)
+        bus.subscribe(EventType.PLAYER_MOVED, callback)
+        bus.subscribe(WILDCARD, callback)
 
         assert bus.subscriber_count() == 3
 
-        await bus.clear_all_subscribers()
+        bus.clear_all_subscribers()
 
         assert bus.subscriber_count() == 0
         assert bus.subscriber_count(EventType.DICE_ROLLED) == 0
@@ -380,8 +430,8 @@ class TestDuplicateSubscriptions:
             received.append(event)
 
         # Subscribe the same callback twice
-        await bus.subscribe(EventType.GAME_STARTED, callback)
-        await bus.subscribe(EventType.GAME_STARTED, callback)
+        bus.subscribe(EventType.GAME_STARTED, callback)
+        bus.subscribe(EventType.GAME_STARTED, callback)
 
         # Should only have one subscription
         assert bus.subscriber_count(EventType.GAME_STARTED) == 1
@@ -400,12 +450,12 @@ class TestDuplicateSubscriptions:
         async def callback(event: GameEvent):
             pass
 
-        await bus.subscribe(EventType.GAME_OVER, callback)
+        bus.subscribe(EventType.GAME_OVER, callback)
         assert bus.subscriber_count(EventType.GAME_OVER) == 1
 
         # Unsubscribe twice
-        await bus.unsubscribe(EventType.GAME_OVER, callback)
-        await bus.unsubscribe(EventType.GAME_OVER, callback)
+        bus.unsubscribe(EventType.GAME_OVER, callback)
+        bus.unsubscribe(EventType.GAME_OVER, callback)
 
         # Should work without error
         assert bus.subscriber_count(EventType.GAME_OVER) == 0
@@ -424,7 +474,7 @@ class TestStringEventTypeConversion:
             received.append(event)
 
         # Subscribe using string
-        await bus.subscribe("DICE_ROLLED", callback)
+        bus.subscribe("DICE_ROLLED", callback)
 
         event = GameEvent(event_type=EventType.DICE_ROLLED, player_id=0, turn_number=1)
         await bus.emit(event)
@@ -439,11 +489,11 @@ class TestStringEventTypeConversion:
         async def callback(event: GameEvent):
             pass
 
-        await bus.subscribe(EventType.PLAYER_MOVED, callback)
+        bus.subscribe(EventType.PLAYER_MOVED, callback)
         assert bus.subscriber_count(EventType.PLAYER_MOVED) == 1
 
         # Unsubscribe using string
-        await bus.unsubscribe("PLAYER_MOVED", callback)
+        bus.unsubscribe("PLAYER_MOVED", callback)
         assert bus.subscriber_count(EventType.PLAYER_MOVED) == 0
 
     @pytest.mark.asyncio
@@ -454,7 +504,184 @@ class TestStringEventTypeConversion:
         async def callback(event: GameEvent):
             pass
 
-        await bus.subscribe(EventType.RENT_PAID, callback)
+        bus.subscribe(EventType.RENT_PAID, callback)
 
         # Count using string
         assert bus.subscriber_count("RENT_PAID") == 1
+
+    @pytest.mark.asyncio
+    async def test_string_names_are_case_insensitive(self):
+        """Lower- and mixed-case names resolve; unknown names still raise KeyError."""
+        bus = EventBus()
+
+        async def callback(event: GameEvent):
+            pass
+
+        bus.subscribe("rent_paid", callback)
+        assert bus.subscriber_count("Rent_Paid") == 1
+        with pytest.raises(KeyError):
+            bus.subscriber_count("not_an_event")
+
+
+class TestTaps:
+    """Test synchronous tap functionality."""
+
+    @pytest.mark.asyncio
+    async def test_tap_receives_all_events_before_subscribers(self):
+        """Taps run inline for every event, before async subscribers."""
+        bus = EventBus()
+        order = []
+
+        def tap(event: GameEvent):
+            order.append(("tap", event.event_type))
+
+        async def callback(event: GameEvent):
+            order.append(("callback", event.event_type))
+
+        bus.add_tap(tap)
+        bus.subscribe(WILDCARD, callback)
+
+        await bus.emit(GameEvent(event_type=EventType.DICE_ROLLED, turn_number=1))
+        await bus.emit(GameEvent(event_type=EventType.PLAYER_MOVED, turn_number=1))
+
+        assert order == [
+            ("tap", EventType.DICE_ROLLED),
+            ("callback", EventType.DICE_ROLLED),
+            ("tap", EventType.PLAYER_MOVED),
+            ("callback", EventType.PLAYER_MOVED),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_remove_tap(self):
+        """Removed taps no longer receive events, and removal is idempotent."""
+        bus = EventBus()
+        received = []
+
+        bus.add_tap(received.append)
+        await bus.emit(GameEvent(event_type=EventType.TURN_STARTED, turn_number=1))
+        bus.remove_tap(received.append)
+        bus.remove_tap(received.append)
+        await bus.emit(GameEvent(event_type=EventType.TURN_STARTED, turn_number=2))
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_tap_exception_doesnt_affect_subscribers(self):
+        """A failing tap is logged and does not block delivery."""
+        bus = EventBus()
+        received = []
+
+        def bad_tap(event: GameEvent):
+            raise ValueError("Intentional test error")
+
+        async def callback(event: GameEvent):
+            received.append(event)
+
+        bus.add_tap(bad_tap)
+        bus.subscribe(EventType.GAME_STARTED, callback)
+        await bus.emit(GameEvent(event_type=EventType.GAME_STARTED, turn_number=0))
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_tap_removing_itself_does_not_skip_next_tap(self):
+        """Emit iterates a snapshot, so removing a tap mid-emit is safe."""
+        bus = EventBus()
+        received = []
+
+        def one_shot(event: GameEvent):
+            bus.remove_tap(one_shot)
+
+        bus.add_tap(one_shot)
+        bus.add_tap(received.append)
+        await bus.emit(GameEvent(event_type=EventType.TURN_STARTED, turn_number=1))
+        await bus.emit(GameEvent(event_type=EventType.TURN_STARTED, turn_number=2))
+
+        assert len(received) == 2
+
+
+class TestEmitNowait:
+    """Test fire-and-forget emission."""
+
+    @pytest.mark.asyncio
+    async def test_emit_nowait_runs_taps_inline_and_schedules_subscribers(self):
+        """Taps see the event immediately; subscribers run later as tasks."""
+        bus = EventBus()
+        tapped, received = [], []
+        release = asyncio.Event()
+
+        async def slow_callback(event: GameEvent):
+            await release.wait()
+            received.append(event)
+
+        bus.add_tap(tapped.append)
+        bus.subscribe(EventType.DICE_ROLLED, slow_callback)
+
+        event = GameEvent(event_type=EventType.DICE_ROLLED, turn_number=1)
+        bus.emit_nowait(event)
+        assert tapped == [event]
+        assert received == []
+
+        release.set()
+        await asyncio.gather(*bus._pending)
+        assert received == [event]
+        assert not bus._pending
+
+    def test_emit_nowait_without_subscribers_needs_no_loop(self):
+        """With only taps registered, emit_nowait works outside an event loop."""
+        bus = EventBus()
+        tapped = []
+        bus.add_tap(tapped.append)
+
+        bus.emit_nowait(GameEvent(event_type=EventType.TURN_STARTED, turn_number=1))
+
+        assert len(tapped) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_callback_task_stays_cancelled(self):
+        """Cancelling a scheduled subscriber is not swallowed as a callback failure."""
+        bus = EventBus()
+
+        async def blocked_callback(event: GameEvent):
+            await asyncio.Event().wait()
+
+        bus.subscribe(EventType.DICE_ROLLED, blocked_callback)
+        bus.emit_nowait(GameEvent(event_type=EventType.DICE_ROLLED, turn_number=1))
+        (task,) = bus._pending
+        await asyncio.sleep(0)
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert task.cancelled()
+
+
+class TestMaxConcurrency:
+    """Test bounded subscriber fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_limits_running_callbacks(self):
+        """No more than max_concurrency callbacks run at the same time."""
+        bus = EventBus(max_concurrency=2)
+        running, peak, done = 0, 0, []
+
+        def make_callback(i: int):
+            async def callback(event: GameEvent):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                done.append(i)
+            return callback
+
+        for i in range(5):
+            bus.subscribe(EventType.DICE_ROLLED, make_callback(i))
+        await bus.emit(GameEvent(event_type=EventType.DICE_ROLLED, turn_number=1))
+
+        assert sorted(done) == [0, 1, 2, 3, 4]
+        assert peak == 2
+
+    def test_max_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError):
+            EventBus(max_concurrency=0)
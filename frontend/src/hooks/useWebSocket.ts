@@ -11,6 +11,9 @@ const WS_BASE_URL = process.env.NEXT_PUBLIC_WS_URL || "ws://localhost:8000";
 const RECONNECT_DELAY = 3000;
 const MAX_RECONNECT_ATTEMPTS = 5;
 
+// The backend sends pre-encoded JSON as binary frames
+const textDecoder = new TextDecoder();
+
 export function useWebSocket(gameId: string | null) {
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectAttemptsRef = useRef(0);
@@ -38,6 +41,7 @@ export function useWebSocket(gameId: string | null) {
 
     try {
       const ws = new WebSocket(wsUrl);
+      ws.binaryType = "arraybuffer";
 
       ws.onopen = () => {
         console.log("✅ WebSocket connected");
@@ -48,7 +52,9 @@ export function useWebSocket(gameId: string | null) {
 
       ws.onmessage = (event) => {
         try {
-          const wsEvent: WSGameEvent = JSON.parse(event.data);
+          const raw =
+            typeof event.data === "string" ? event.data : textDecoder.decode(event.data);
+          const wsEvent: WSGameEvent = JSON.parse(raw);
           console.log("📨 WebSocket event:", wsEvent.event, wsEvent.data);
           handleWSEvent(wsEvent);
         } catch (error) {